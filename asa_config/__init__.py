@@ -1,11 +1,132 @@
-from ._argument import *
-from ._object import *
-from ._object_load import *
-from ._rule import *
-
-__all__ = (
-    _argument.__all__ +
-    _object.__all__ +
-    _object_load.__all__ +
-    _rule.__all__
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._argument import *
+    from ._async_load import *
+    from ._columnar import *
+    from ._index import *
+    from ._match_cache import *
+    from ._object import *
+    from ._object_load import *
+    from ._parallel import *
+    from ._query import *
+    from ._reload import *
+    from ._rule import *
+    from ._rule_set import *
+    from ._snapshot import *
+    from ._stats import *
+
+
+_EXPORTS = {
+    "_argument": (
+        "ArgumentGroup",
+        "ArgumentGroupRecord"
+    ),
+    "_async_load": (
+        "AsyncLineSource",
+        "aload"
+    ),
+    "_columnar": (
+        "ColumnTable",
+        "IntegerColumn",
+        "StringColumn",
+        "export_columns"
+    ),
+    "_index": (
+        "ConfigIndex",
+    ),
+    "_match_cache": (
+        "MatchCache",
+    ),
+    "_object": (
+        "Object",
+        "ObjectGroup",
+        "ObjectGroupRecord",
+        "ObjectRecord"
+    ),
+    "_object_load": (
+        "iter_load",
+        "iter_load_file",
+        "load",
+        "load_file"
+    ),
+    "_parallel": (
+        "LoadResult",
+        "Source",
+        "load_many"
+    ),
+    "_query": (
+        "AccessListQuery",
+        "Flow"
+    ),
+    "_reload": (
+        "ReloadResult",
+        "reload"
+    ),
+    "_rule": (
+        "FirstMatch",
+        "Heads",
+        "IntegerRule",
+        "LiteralRule",
+        "Matcher",
+        "MatchError",
+        "MatchGenerator",
+        "OffsetMatchGenerator",
+        "NoneRule",
+        "Object",
+        "ObjectRule",
+        "OptionalRule",
+        "ObjectRuleProperty",
+        "Rule",
+        "StringRule",
+        "TupleRule",
+        "TextRule",
+        "UnionRule",
+        "match_object",
+        "match_object_group"
+    ),
+    "_rule_set": (
+        "RuleSet",
+        "compile_rules"
+    ),
+    "_snapshot": (
+        "Snapshot",
+        "SnapshotError",
+        "SnapshotGroup",
+        "SnapshotObject",
+        "dump_snapshot",
+        "load_snapshot"
+    ),
+    "_stats": (
+        "MatchStats",
+        "RuleStats",
+        "current_stats"
+    )
+}
+
+_MODULES = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = tuple(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+
+    if module is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,13 +1,44 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 __all__ = (
     "ArgumentGroup",
+    "ArgumentGroupRecord"
 )
 
 
 class ArgumentGroup(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     root: list[str]
     children: list[ArgumentGroup]
+
+
+class ArgumentGroupRecord:
+    __slots__ = ("root", "children")
+
+    def __init__(
+        self,
+        root: list[str],
+        children: list[ArgumentGroupRecord]
+    ):
+        self.root = root
+        self.children = children
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArgumentGroupRecord):
+            return NotImplemented
+
+        return self.root == other.root and self.children == other.children
+
+    def __repr__(self) -> str:
+        return f"ArgumentGroupRecord(root={self.root!r}, " \
+            f"children={self.children!r})"
+
+    def to_model(self) -> ArgumentGroup:
+        return ArgumentGroup.model_construct(
+            root=self.root,
+            children=[child.to_model() for child in self.children]
+        )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+import mmap
+import os
 
-from ._argument import ArgumentGroup
+from typing import Iterable, Iterator
+
+from ._argument import ArgumentGroup, ArgumentGroupRecord
 from ._io import Readable, get_stream
 
 
@@ -10,10 +13,18 @@ __all__ = (
     "ArgumentReadError",
     "IndentationError",
 
-    "load"
+    "iter_load",
+    "iter_load_file",
+    "load",
+    "load_file"
 )
 
 
+_CHUNK_SIZE = 1 << 20
+
+_MAX_INTERNED_TOKENS = 1 << 16
+
+
 class ArgumentReadError(Exception):
     pass
 
@@ -22,42 +33,29 @@ class IndentationError(ArgumentReadError):
     pass
 
 
-class _ArgumentEntry(BaseModel):
-    arguments: list[str]
-    indentation_level: int
-
-
-def _read_indentation(
-    text: str,
-    indentation_string: str | None
-) -> tuple[int, int, str | None]:
-    index = 0
-    indentation_level = 0
-    indentation_character = indentation_string[0] \
-        if indentation_string else None
-
-    whitespaces = ""
+class _ArgumentEntry:
+    __slots__ = ("arguments", "indentation_level")
 
-    while True:
-        current_character = text[index]
+    def __init__(self, arguments: list[str], indentation_level: int):
+        self.arguments = arguments
+        self.indentation_level = indentation_level
 
-        if current_character not in (" ", "\t"):
-            break
 
-        if indentation_character is None:
-            indentation_character = current_character
-        else:
-            if current_character != indentation_character:
-                raise IndentationError
+def _measure_indentation(
+    whitespaces: str,
+    indentation_string: str | None
+) -> tuple[int, str | None]:
+    if not whitespaces:
+        return 0, None
 
-        whitespaces += current_character
-        index += 1
+    indentation_character = indentation_string[0] \
+        if indentation_string else whitespaces[0]
 
-    if not whitespaces:
-        return 0, index, None
+    if whitespaces.count(indentation_character) != len(whitespaces):
+        raise IndentationError
 
     if indentation_string is None:
-        return 1, index, whitespaces
+        return 1, whitespaces
 
     indentation_level = len(whitespaces) // len(indentation_string)
     remainder = len(whitespaces) % len(indentation_string)
@@ -65,66 +63,89 @@ def _read_indentation(
     if remainder != 0:
         raise IndentationError
 
+    return indentation_level, indentation_string
+
+
+def _read_indentation(
+    text: str,
+    indentation_string: str | None
+) -> tuple[int, int, str | None]:
+    index = len(text) - len(text.lstrip(" \t"))
+    indentation_level, indentation_string = _measure_indentation(
+        text[:index],
+        indentation_string
+    )
+
     return indentation_level, index, indentation_string
 
 
+def _split_tokens(text: str, tokens: dict[str, str]) -> list[str]:
+    if len(tokens) < _MAX_INTERNED_TOKENS:
+        intern = tokens.setdefault
+    else:
+        intern = tokens.get
+
+    return [intern(token, token) for token in text.split(" ")]
+
+
 def _group_entries(
-    entries: list[_ArgumentEntry],
+    entries: Iterable[_ArgumentEntry],
     current_indentation_level: int = 0
-) -> list[ArgumentGroup]:
+) -> list[ArgumentGroupRecord]:
     groups = []
+    path = []
 
-    if not entries:
-        return groups
+    for entry in entries:
+        depth = entry.indentation_level - current_indentation_level
 
-    current_entry = entries[0]
-    next_entry = None
-    children = []
+        if depth > len(path) or (not groups and depth != 0):
+            raise ValueError("Indentation mismatch")
 
-    if not current_entry.indentation_level == current_indentation_level:
-        raise ValueError("Indentation mismatch")
+        if depth < 0:
+            raise ValueError("Unexpected indentation level")
 
-    index = 1
+        del path[depth:]
 
-    def finalize():
-        group = ArgumentGroup(
-            root=current_entry.arguments,
-            children=_group_entries(
-                children,
-                current_indentation_level + 1
-            )
-        )
+        group = ArgumentGroupRecord(entry.arguments, [])
 
-        groups.append(group)
+        if path:
+            path[-1].children.append(group)
+        else:
+            groups.append(group)
 
-    while True:
-        if index == len(entries):
-            finalize()
+        path.append(group)
 
-            return groups
+    return groups
 
-        next_entry = entries[index]
 
-        if next_entry.indentation_level == current_indentation_level:
-            finalize()
+def _read_entry(
+    text: str,
+    previous_indentation_level: int,
+    previous_indentation_string: str | None,
+    tokens: dict[str, str]
+) -> tuple[_ArgumentEntry, str | None]:
+    current_indentation_level, index, current_indentation_string = \
+        _read_indentation(text, previous_indentation_string)
+
+    if current_indentation_level > previous_indentation_level + 1:
+        raise IndentationError
 
-            children = []
-            current_entry = next_entry
-            index += 1
-        elif next_entry.indentation_level > current_indentation_level:
-            children.append(next_entry)
+    arguments = _split_tokens(text[index:].rstrip(), tokens)
 
-            index += 1
-        else:
-            raise ValueError("Unexpected indentation level")
+    entry = _ArgumentEntry(
+        arguments=arguments,
+        indentation_level=current_indentation_level
+    )
 
+    return entry, current_indentation_string
 
-def _read_entries(readable: Readable) -> list[_ArgumentEntry]:
+
+def _iter_entries(readable: Readable) -> Iterator[_ArgumentEntry]:
     stream = get_stream(readable)
-    entries = []
 
     previous_indentation_level = 0
     previous_indentation_string = None
+    tokens = {}
 
     while True:
         text = stream.readline()
@@ -135,29 +156,164 @@ def _read_entries(readable: Readable) -> list[_ArgumentEntry]:
         if text.isspace():
             continue
 
-        current_indentation_level, index, current_indentation_string = \
-            _read_indentation(text, previous_indentation_string)
+        entry, previous_indentation_string = _read_entry(
+            text,
+            previous_indentation_level,
+            previous_indentation_string,
+            tokens
+        )
 
-        if current_indentation_level > previous_indentation_level + 1:
-            raise IndentationError
+        yield entry
 
-        arguments = text[index:].rstrip().split(" ")
+        previous_indentation_level = entry.indentation_level
+
+
+def _iter_chunks(buffer: mmap.mmap) -> Iterator[bytes]:
+    size = len(buffer)
+    position = 0
+
+    while position < size:
+        end = buffer.rfind(b"\n", position, position + _CHUNK_SIZE)
+
+        if end == -1 or position + _CHUNK_SIZE >= size:
+            end = size
+        else:
+            end += 1
+
+        yield buffer[position:end]
+
+        position = end
+
+
+def _scan_entries(chunks: Iterable[bytes]) -> Iterator[_ArgumentEntry]:
+    previous_indentation_level = 0
+    previous_indentation_string = None
+    indentations = {}
+    tokens = {}
+
+    for chunk in chunks:
+        for line in chunk.split(b"\n"):
+            stripped = line.lstrip(b" \t")
+            text = stripped.decode("utf-8").rstrip()
+
+            if not text:
+                continue
+
+            if len(stripped) == len(line):
+                current_indentation_level = 0
+                current_indentation_string = None
+            else:
+                key = (
+                    line[:len(line) - len(stripped)],
+                    previous_indentation_string
+                )
+                indentation = indentations.get(key)
+
+                if indentation is None:
+                    indentation = _measure_indentation(
+                        key[0].decode("ascii"),
+                        previous_indentation_string
+                    )
+                    indentations[key] = indentation
+
+                current_indentation_level, current_indentation_string = \
+                    indentation
+
+                if current_indentation_level > \
+                        previous_indentation_level + 1:
+                    raise IndentationError
+
+            yield _ArgumentEntry(
+                _split_tokens(text, tokens),
+                current_indentation_level
+            )
+
+            previous_indentation_level = current_indentation_level
+            previous_indentation_string = current_indentation_string
+
+
+def _iter_file_entries(path: str | os.PathLike) -> Iterator[_ArgumentEntry]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from _scan_entries(_iter_chunks(buffer))
 
-        entry = _ArgumentEntry(
-            arguments=arguments,
-            indentation_level=current_indentation_level
-        )
 
-        entries.append(entry)
+def _read_entries(readable: Readable) -> list[_ArgumentEntry]:
+    return list(_iter_entries(readable))
+
+
+def _iter_blocks(
+    entries: Iterable[_ArgumentEntry]
+) -> Iterator[list[_ArgumentEntry]]:
+    block = []
+
+    for entry in entries:
+        if entry.indentation_level == 0 and block:
+            yield block
+
+            block = []
+
+        block.append(entry)
+
+    if block:
+        yield block
+
+
+def _iter_records(
+    entries: Iterable[_ArgumentEntry]
+) -> Iterator[ArgumentGroupRecord]:
+    for block in _iter_blocks(entries):
+        yield from _group_entries(block)
+
 
-        previous_indentation_level = current_indentation_level
-        previous_indentation_string = current_indentation_string
+def iter_load(
+    readable: Readable,
+    models: bool = True
+) -> Iterator[ArgumentGroup | ArgumentGroupRecord]:
+    records = _iter_records(_iter_entries(readable))
 
-    return entries
+    if not models:
+        yield from records
 
+        return
 
-def load(readable: Readable) -> list[ArgumentGroup]:
+    for record in records:
+        yield record.to_model()
+
+
+def iter_load_file(
+    path: str | os.PathLike,
+    models: bool = True
+) -> Iterator[ArgumentGroup | ArgumentGroupRecord]:
+    records = _iter_records(_iter_file_entries(path))
+
+    if not models:
+        yield from records
+
+        return
+
+    for record in records:
+        yield record.to_model()
+
+
+def load(
+    readable: Readable,
+    models: bool = True
+) -> list[ArgumentGroup] | list[ArgumentGroupRecord]:
     entries = _read_entries(readable)
     groups = _group_entries(entries)
 
+    if models:
+        return [group.to_model() for group in groups]
+
     return groups
+
+
+def load_file(
+    path: str | os.PathLike,
+    models: bool = True
+) -> list[ArgumentGroup] | list[ArgumentGroupRecord]:
+    return list(iter_load_file(path, models=models))
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Iterable, Union
+
+from ._argument_load import _ArgumentEntry, _group_entries, _read_entry
+from ._object import ObjectGroup, ObjectGroupRecord
+from ._rule import ObjectRule, match_object_group
+from ._rule_set import RuleSet, compile_rules
+
+
+__all__ = (
+    "AsyncLineSource",
+
+    "aload"
+)
+
+
+AsyncLineSource = Union[asyncio.StreamReader, AsyncIterable[Union[str, bytes]]]
+
+
+_OFFLOAD_LINES = 32
+
+
+async def _aiter_entries(
+    source: AsyncLineSource
+) -> AsyncIterator[_ArgumentEntry]:
+    previous_indentation_level = 0
+    previous_indentation_string = None
+    tokens = {}
+
+    async for text in source:
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+
+        if not text or text.isspace():
+            continue
+
+        entry, previous_indentation_string = _read_entry(
+            text,
+            previous_indentation_level,
+            previous_indentation_string,
+            tokens
+        )
+
+        yield entry
+
+        previous_indentation_level = entry.indentation_level
+
+
+async def _aiter_blocks(
+    source: AsyncLineSource
+) -> AsyncIterator[list[_ArgumentEntry]]:
+    block = []
+
+    async for entry in _aiter_entries(source):
+        if entry.indentation_level == 0 and block:
+            yield block
+
+            block = []
+
+        block.append(entry)
+
+    if block:
+        yield block
+
+
+async def _match_block(
+    block: list[_ArgumentEntry],
+    rules: RuleSet,
+    models: bool,
+    executor: Executor | None,
+    offload_lines: int
+) -> list[ObjectGroup | ObjectGroupRecord]:
+    groups = _group_entries(block)
+
+    if len(block) < offload_lines:
+        return [
+            match_object_group(group, rules, models=models)
+            for group in groups
+        ]
+
+    loop = asyncio.get_running_loop()
+
+    return [
+        await loop.run_in_executor(
+            executor,
+            partial(match_object_group, group, rules, models=models)
+        )
+        for group in groups
+    ]
+
+
+async def aload(
+    source: AsyncLineSource,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    executor: Executor | None = None,
+    offload_lines: int = _OFFLOAD_LINES
+) -> AsyncIterator[ObjectGroup | ObjectGroupRecord]:
+    rules = compile_rules(rules)
+    inline_lines = 0
+
+    async for block in _aiter_blocks(source):
+        groups = await _match_block(
+            block,
+            rules,
+            models,
+            executor,
+            offload_lines
+        )
+
+        if len(block) < offload_lines:
+            inline_lines += len(block)
+
+            if inline_lines >= offload_lines:
+                inline_lines = 0
+
+                await asyncio.sleep(0)
+
+        for group in groups:
+            yield group
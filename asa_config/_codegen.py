@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from ._object import ObjectRecord, _TextSpan
+from ._rule import (
+    FirstMatch,
+    IntegerRule,
+    LiteralRule,
+    NoneRule,
+    ObjectRule,
+    Rule,
+    StringRule,
+    TextRule,
+    TupleRule,
+    UnionRule
+)
+
+
+__all__ = (
+    "CompiledMatcher",
+
+    "compile_matcher",
+    "generate_source"
+)
+
+
+CompiledMatcher = Callable[[Sequence[str], int], FirstMatch]
+
+
+_compiled: dict[str, CompiledMatcher] = {}
+
+
+def _alternatives(rule: Rule) -> list[Rule]:
+    if isinstance(rule, UnionRule):
+        return [
+            alternative
+            for value in rule.values
+            for alternative in _alternatives(value)
+        ]
+
+    return [rule]
+
+
+class _Generator:
+    def __init__(self):
+        self.constants: list[str] = []
+        self.functions: list[str] = []
+        self.names: dict[int, str] = {}
+        self.values: dict[str, str] = {}
+
+    def constant(self, value: Any) -> str:
+        if isinstance(value, frozenset):
+            source = f"frozenset({tuple(sorted(value))!r})"
+        else:
+            source = repr(value)
+
+        name = self.values.get(source)
+
+        if name is None:
+            name = self.values[source] = f"_c{len(self.values)}"
+            self.constants.append(f"{name} = {source}")
+
+        return name
+
+    def function(self, rule: ObjectRule | TupleRule) -> str:
+        name = self.names.get(id(rule))
+
+        if name is not None:
+            return name
+
+        name = self.names[id(rule)] = f"_f{len(self.names)}"
+        lines = [f"def {name}(tokens, pos, n):"]
+
+        if isinstance(rule, ObjectRule):
+            rules = [prop.value for prop in rule.properties]
+            rule_name = self.constant(rule.name)
+
+            lines += [
+                f"    if pos >= n or tokens[pos] != {rule_name}:",
+                "        return None",
+                "    pos += 1"
+            ]
+        else:
+            rules = rule.values
+
+        if not rules:
+            lines.append("    return None")
+            self.functions.append("\n".join(lines))
+
+            return name
+
+        variables = [f"v{index}" for index in range(len(rules))]
+
+        for variable, value in zip(variables, rules):
+            self.element(lines, value, variable)
+
+        values = f"({', '.join(variables)},)"
+
+        if isinstance(rule, ObjectRule):
+            names = self.constant(tuple(prop.name for prop in rule.properties))
+            lines.append(
+                f"    return _lazy({rule_name}, {names}, {values}), pos"
+            )
+        else:
+            lines.append(f"    return {values}, pos")
+
+        self.functions.append("\n".join(lines))
+
+        return name
+
+    def element(self, lines: list[str], rule: Rule, variable: str) -> None:
+        alternatives = _alternatives(rule)
+        literals: list[str] = []
+
+        lines.append("    while True:")
+
+        for alternative in alternatives:
+            if isinstance(alternative, LiteralRule):
+                literals.append(alternative.value.lower())
+
+                continue
+
+            self.literals(lines, literals, variable)
+            literals = []
+
+            if isinstance(alternative, NoneRule):
+                lines += [
+                    f"        {variable} = None",
+                    "        break"
+                ]
+
+                return
+
+            self.alternative(lines, alternative, variable)
+
+        self.literals(lines, literals, variable)
+        lines.append("        return None")
+
+    def literals(
+        self,
+        lines: list[str],
+        literals: list[str],
+        variable: str
+    ) -> None:
+        if not literals:
+            return
+
+        if len(literals) == 1:
+            check = f"== {self.constant(literals[0])}"
+        else:
+            check = f"in {self.constant(frozenset(literals))}"
+
+        lines += [
+            f"        if pos < n and tokens[pos].lower() {check}:",
+            f"            {variable} = tokens[pos]",
+            "            pos += 1",
+            "            break"
+        ]
+
+    def alternative(
+        self,
+        lines: list[str],
+        rule: Rule,
+        variable: str
+    ) -> None:
+        if isinstance(rule, IntegerRule):
+            lines += [
+                "        if pos < n:",
+                "            try:",
+                f"                {variable} = int(tokens[pos])",
+                "            except ValueError:",
+                "                pass",
+                "            else:",
+                "                pos += 1",
+                "                break"
+            ]
+        elif isinstance(rule, StringRule):
+            lines += [
+                "        if pos < n:",
+                f"            {variable} = tokens[pos]",
+                "            pos += 1",
+                "            break"
+            ]
+        elif isinstance(rule, TextRule):
+            lines += [
+                "        if pos < n:",
+                f"            {variable} = _TextSpan(tokens, pos)",
+                "            pos = n",
+                "            break"
+            ]
+        elif isinstance(rule, ObjectRule):
+            function = self.function(rule)
+            rule_name = self.constant(rule.name)
+
+            lines += [
+                f"        if pos < n and tokens[pos] == {rule_name}:",
+                f"            result = {function}(tokens, pos, n)",
+                "            if result is not None:",
+                f"                {variable}, pos = result",
+                "                break"
+            ]
+        elif isinstance(rule, TupleRule):
+            function = self.function(rule)
+
+            lines += [
+                f"        result = {function}(tokens, pos, n)",
+                "        if result is not None:",
+                f"            {variable}, pos = result",
+                "            break"
+            ]
+        else:
+            raise TypeError(f"Cannot compile {type(rule).__name__}")
+
+
+def generate_source(rule: ObjectRule) -> str:
+    generator = _Generator()
+    function = generator.function(rule)
+
+    return "\n\n\n".join([
+        "\n".join(generator.constants),
+        *generator.functions,
+        "def match(tokens, start):\n"
+        f"    return {function}(tokens, start, len(tokens))"
+    ]) + "\n"
+
+
+def compile_matcher(rule: ObjectRule) -> CompiledMatcher:
+    source = generate_source(rule)
+    matcher = _compiled.get(source)
+
+    if matcher is None:
+        namespace = {"_lazy": ObjectRecord._lazy, "_TextSpan": _TextSpan}
+        code = compile(source, f"<asa_config rule {rule.name}>", "exec")
+
+        exec(code, namespace)
+
+        matcher = _compiled[source] = namespace["match"]
+
+    return matcher
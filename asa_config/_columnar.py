@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import sys
+
+from array import array
+from typing import Any, Iterable, Iterator, Union
+
+from ._object import Object, ObjectGroup, ObjectGroupRecord, ObjectRecord
+
+
+__all__ = (
+    "ColumnTable",
+    "IntegerColumn",
+    "StringColumn",
+
+    "export_columns"
+)
+
+
+_Group = Union[ObjectGroup, ObjectGroupRecord]
+
+
+class IntegerColumn:
+    __slots__ = ("values", "validity")
+
+    def __init__(self, values: array, validity: bytearray):
+        self.values = values
+        self.validity = validity
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> int | None:
+        return self.values[index] if self.validity[index] else None
+
+    def to_pylist(self) -> list[int | None]:
+        return [
+            value if valid else None
+            for value, valid in zip(self.values, self.validity)
+        ]
+
+    def to_arrow(self):
+        import pyarrow
+
+        return pyarrow.array(self.to_pylist(), type=pyarrow.int64())
+
+
+class StringColumn:
+    __slots__ = ("codes", "dictionary")
+
+    def __init__(self, codes: array, dictionary: list[str]):
+        self.codes = codes
+        self.dictionary = dictionary
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str | None:
+        code = self.codes[index]
+
+        return self.dictionary[code] if code >= 0 else None
+
+    def code(self, value: str) -> int:
+        try:
+            return self.dictionary.index(value)
+        except ValueError:
+            return -1
+
+    def to_pylist(self) -> list[str | None]:
+        dictionary = self.dictionary
+
+        return [dictionary[code] if code >= 0 else None for code in self.codes]
+
+    def to_arrow(self):
+        import pyarrow
+
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(
+                [code if code >= 0 else None for code in self.codes],
+                type=pyarrow.int32()
+            ),
+            pyarrow.array(self.dictionary, type=pyarrow.string())
+        )
+
+
+Column = Union[IntegerColumn, StringColumn]
+
+
+class ColumnTable:
+    def __init__(self, name: str, rows: int, columns: dict[str, Column]):
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def to_pydict(self) -> dict[str, list[Any]]:
+        return {
+            name: column.to_pylist() for name, column in self.columns.items()
+        }
+
+    def to_arrow(self):
+        import pyarrow
+
+        return pyarrow.table({
+            name: column.to_arrow() for name, column in self.columns.items()
+        })
+
+
+class _ColumnBuilder:
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = []
+
+    def append(self, row: int, value: Any) -> None:
+        missing = row - len(self.values)
+
+        if missing:
+            self.values.extend([None] * missing)
+
+        self.values.append(value)
+
+    def build(self, rows: int) -> Column:
+        values = self.values
+        values.extend([None] * (rows - len(values)))
+
+        if all(
+            value is None or type(value) is int for value in values
+        ) and any(value is not None for value in values):
+            try:
+                return IntegerColumn(
+                    array("q", [value or 0 for value in values]),
+                    bytearray(value is not None for value in values)
+                )
+            except OverflowError:
+                pass
+
+        codes = array("i")
+        dictionary = []
+        lookup: dict[str, int] = {}
+
+        for value in values:
+            if value is None:
+                codes.append(-1)
+
+                continue
+
+            if type(value) is not str:
+                value = str(value)
+
+            code = lookup.get(value)
+
+            if code is None:
+                code = lookup[value] = len(dictionary)
+                dictionary.append(sys.intern(value))
+
+            codes.append(code)
+
+        return StringColumn(codes, dictionary)
+
+
+def _flatten(prefix: str, value: Any) -> Iterator[tuple[str, Any]]:
+    if isinstance(value, (Object, ObjectRecord)):
+        yield prefix, value.name
+
+        for name, item in value.properties.items():
+            yield from _flatten(f"{prefix}.{name}", item)
+    elif isinstance(value, tuple):
+        for index, item in enumerate(value):
+            yield from _flatten(f"{prefix}.{index}", item)
+    else:
+        yield prefix, value
+
+
+def _iter_roots(
+    groups: Iterable[_Group],
+    name: str
+) -> Iterator[Object | ObjectRecord]:
+    for group in groups:
+        if group.root.name == name:
+            yield group.root
+
+        if group.children:
+            yield from _iter_roots(group.children, name)
+
+
+def export_columns(groups: Iterable[_Group], name: str) -> ColumnTable:
+    builders: dict[str, _ColumnBuilder] = {}
+    rows = 0
+
+    for root in _iter_roots(groups, name):
+        for property_name, value in root.properties.items():
+            for path, item in _flatten(property_name, value):
+                builder = builders.get(path)
+
+                if builder is None:
+                    builder = builders[path] = _ColumnBuilder()
+
+                builder.append(rows, item)
+
+        rows += 1
+
+    order = {path: index for index, path in enumerate(builders)}
+    paths = sorted(
+        builders,
+        key=lambda path: (order.get(path.split(".", 1)[0], -1), order[path])
+    )
+
+    return ColumnTable(
+        name,
+        rows,
+        {path: builders[path].build(rows) for path in paths}
+    )
@@ -1,29 +1,154 @@
-__all__ = (
-    "decision_tree",
-)
-
-
-def decision_tree(generators):
-    def walk(*args, **kwargs):
-        nonlocal generators
-
-        if len(generators) == 0:
-            return
-
-        if len(generators) == 1:
-            for item in generators[0](*args, **kwargs):
-                result, _, _ = item
-
-                yield (result,)
-
-            return
-
-        generator, *generators = generators
-
-        for item in generator(*args, **kwargs):
-            result, args, kwargs = item
-
-            for rest in decision_tree(generators)(*args, **kwargs):
-                yield (result, *rest)
-
-    return walk
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Generator, Iterable, Iterator, Protocol, Sequence
+
+from ._stats import RuleStats
+
+
+__all__ = (
+    "DecisionGenerator",
+    "Memo",
+    "OffsetMatcher",
+
+    "match_memoized",
+    "match_sequence",
+)
+
+
+DecisionGenerator = Generator[tuple[tuple[Any, ...], int], None, None]
+
+Memo = dict[tuple[int, int], "_Stream"]
+
+
+class OffsetMatcher(Protocol):
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> Iterator[tuple[Any, int]]:
+        ...
+
+
+class _Stream:
+    __slots__ = ("_generator", "_items")
+
+    def __init__(self, generator: Iterator[tuple[Any, int]]):
+        self._generator = generator
+        self._items = []
+
+    def __iter__(self) -> Iterator[tuple[Any, int]]:
+        index = 0
+
+        while True:
+            if index < len(self._items):
+                yield self._items[index]
+
+                index += 1
+                continue
+
+            if self._generator is None:
+                return
+
+            try:
+                item = next(self._generator)
+            except StopIteration:
+                self._generator = None
+
+                return
+
+            self._items.append(item)
+
+
+def match_memoized(
+    matcher: OffsetMatcher,
+    tokens: Sequence[str],
+    start: int,
+    memo: Memo
+) -> _Stream:
+    key = (id(matcher), start)
+    stream = memo.get(key)
+
+    if stream is None:
+        stream = _Stream(matcher.match_at(tokens, start, memo))
+        memo[key] = stream
+
+    return stream
+
+
+def _observe(
+    candidates: Iterable[tuple[Any, int]],
+    stats: RuleStats
+) -> Iterator[tuple[Any, int]]:
+    stats.attempts += 1
+
+    iterator = iter(candidates)
+    produced = False
+
+    while True:
+        start = perf_counter()
+
+        try:
+            item = next(iterator)
+        except StopIteration:
+            stats.seconds += perf_counter() - start
+
+            return
+
+        stats.seconds += perf_counter() - start
+
+        if produced:
+            stats.backtracks += 1
+        else:
+            stats.successes += 1
+            produced = True
+
+        yield item
+
+
+def match_sequence(
+    matchers: Sequence[OffsetMatcher],
+    tokens: Sequence[str],
+    start: int = 0,
+    memo: Memo | None = None,
+    observers: Sequence[RuleStats] | None = None
+) -> DecisionGenerator:
+    count = len(matchers)
+
+    if count == 0:
+        return
+
+    if memo is None:
+        memo = {}
+
+    dead: set[tuple[int, int]] = set()
+    path: list[Any] = [None] * count
+
+    def walk(index: int, offset: int) -> DecisionGenerator:
+        if index == count:
+            yield tuple(path), offset
+
+            return
+
+        if (index, offset) in dead:
+            return
+
+        found = False
+        candidates = match_memoized(matchers[index], tokens, offset, memo)
+
+        if observers is not None:
+            candidates = _observe(candidates, observers[index])
+
+        for value, end in candidates:
+            path[index] = value
+
+            for decision in walk(index + 1, end):
+                found = True
+
+                yield decision
+
+        if not found:
+            dead.add((index, offset))
+
+    yield from walk(0, start)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Union
+
+from ._object import Object, ObjectGroup, ObjectGroupRecord, ObjectRecord
+
+
+__all__ = (
+    "ConfigIndex",
+)
+
+
+_REFERENCE_NAMES = frozenset(("object", "object-group"))
+
+
+_Group = Union[ObjectGroup, ObjectGroupRecord]
+
+_Key = tuple[str, str]
+
+
+def _iter_references(value: Any) -> Iterator[_Key]:
+    if isinstance(value, (Object, ObjectRecord)):
+        name = value.properties.get("name")
+
+        if value.name in _REFERENCE_NAMES and isinstance(name, str):
+            yield value.name, name
+
+        for item in value.properties.values():
+            yield from _iter_references(item)
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from _iter_references(item)
+
+
+def _iter_group_references(group: _Group) -> Iterator[_Key]:
+    for value in group.root.properties.values():
+        yield from _iter_references(value)
+
+    for child in group.children:
+        yield from _iter_group_references(child)
+
+
+class ConfigIndex:
+    def __init__(self, groups: Iterable[_Group]):
+        self.groups = list(groups)
+
+        self._definitions: dict[_Key, _Group] = {}
+        self._access_lists: dict[str, list[_Group]] = {}
+        self._references: dict[_Key, list[_Group]] = {}
+
+        for group in self.groups:
+            root = group.root
+            name = root.properties.get("name")
+
+            if isinstance(name, str):
+                if root.name == "access-list":
+                    self._access_lists.setdefault(name, []).append(group)
+                else:
+                    self._definitions.setdefault((root.name, name), group)
+
+            for key in _iter_group_references(group):
+                referrers = self._references.setdefault(key, [])
+
+                if not referrers or referrers[-1] is not group:
+                    referrers.append(group)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def get(self, name: str, key: str) -> _Group | None:
+        return self._definitions.get((name, key))
+
+    def access_list(self, name: str) -> list[_Group]:
+        return list(self._access_lists.get(name, ()))
+
+    def access_list_names(self) -> list[str]:
+        return list(self._access_lists)
+
+    def references(self, name: str, key: str) -> list[_Group]:
+        return list(self._references.get((name, key), ()))
+
+    def members(self, name: str) -> list[_Group]:
+        group = self._definitions.get(("object-group", name))
+
+        if group is None:
+            raise KeyError(name)
+
+        members = []
+
+        for child in group.children:
+            for key in _iter_group_references(child):
+                member = self._definitions.get(key)
+
+                if member is not None:
+                    members.append(member)
+
+        return members
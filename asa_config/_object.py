@@ -1,22 +1,193 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 __all__ = (
     "Object",
-    "ObjectGroup"
+    "ObjectGroup",
+    "ObjectGroupRecord",
+    "ObjectRecord"
 )
 
 
 class Object(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     properties: OrderedDict[str, Any]
 
 
 class ObjectGroup(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     root: Object
     children: list[ObjectGroup]
+
+
+class _TextSpan:
+    __slots__ = ("tokens", "start")
+
+    def __init__(self, tokens: Sequence[str], start: int):
+        self.tokens = tokens
+        self.start = start
+
+    def __str__(self) -> str:
+        return " ".join(self.tokens[self.start:])
+
+    def __repr__(self) -> str:
+        return f"_TextSpan({str(self)!r})"
+
+
+def _resolve(value: Any) -> Any:
+    if isinstance(value, _TextSpan):
+        return str(value)
+
+    if isinstance(value, tuple):
+        return tuple(_resolve(item) for item in value)
+
+    return value
+
+
+def _to_model(value: Any) -> Any:
+    if isinstance(value, ObjectRecord):
+        return value.to_model()
+
+    if isinstance(value, _TextSpan):
+        return str(value)
+
+    if isinstance(value, tuple):
+        return tuple(_to_model(item) for item in value)
+
+    return value
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, ObjectRecord):
+        return value._copy()
+
+    if isinstance(value, tuple):
+        return tuple(_copy(item) for item in value)
+
+    return value
+
+
+class ObjectRecord:
+    __slots__ = ("name", "_names", "_values", "_properties", "_model")
+
+    def __init__(self, name: str, properties: dict[str, Any]):
+        self.name = name
+        self._names = None
+        self._values = None
+        self._properties = properties
+        self._model = None
+
+    @classmethod
+    def _lazy(
+        cls,
+        name: str,
+        names: tuple[str, ...],
+        values: tuple[Any, ...]
+    ) -> ObjectRecord:
+        record = cls.__new__(cls)
+        record.name = name
+        record._names = names
+        record._values = values
+        record._properties = None
+        record._model = None
+
+        return record
+
+    def _copy(self) -> ObjectRecord:
+        if self._properties is None:
+            return ObjectRecord._lazy(
+                self.name,
+                self._names,
+                _copy(self._values)
+            )
+
+        return ObjectRecord(
+            self.name,
+            {name: _copy(value) for name, value in self._properties.items()}
+        )
+
+    def __getstate__(self):
+        return self.name, self.properties
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        if self._properties is None:
+            self._properties = dict(
+                zip(self._names, _resolve(self._values))
+            )
+            self._names = self._values = None
+
+        return self._properties
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if self._properties is not None:
+            return self._properties.get(name, default)
+
+        try:
+            index = self._names.index(name)
+        except ValueError:
+            return default
+
+        return _resolve(self._values[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ObjectRecord):
+            return NotImplemented
+
+        return self.name == other.name and \
+            list(self.properties.items()) == list(other.properties.items())
+
+    def __repr__(self) -> str:
+        return f"ObjectRecord(name={self.name!r}, " \
+            f"properties={self.properties!r})"
+
+    def to_model(self) -> Object:
+        if self._model is None:
+            if self._properties is None:
+                items = zip(self._names, self._values)
+            else:
+                items = self._properties.items()
+
+            self._model = Object.model_construct(
+                name=self.name,
+                properties=OrderedDict(
+                    (name, _to_model(value)) for name, value in items
+                )
+            )
+
+        return self._model
+
+
+class ObjectGroupRecord:
+    __slots__ = ("root", "children")
+
+    def __init__(self, root: ObjectRecord, children: list[ObjectGroupRecord]):
+        self.root = root
+        self.children = children
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ObjectGroupRecord):
+            return NotImplemented
+
+        return self.root == other.root and self.children == other.children
+
+    def __repr__(self) -> str:
+        return f"ObjectGroupRecord(root={self.root!r}, " \
+            f"children={self.children!r})"
+
+    def to_model(self) -> ObjectGroup:
+        return ObjectGroup.model_construct(
+            root=self.root.to_model(),
+            children=[child.to_model() for child in self.children]
+        )
@@ -1,18 +1,177 @@
-from ._argument_load import load as load_argument_groups
+import os
+
+from typing import Iterable, Iterator
+
+from ._argument_load import (
+    _ArgumentEntry,
+    _group_entries,
+    _iter_blocks,
+    _iter_entries,
+    _iter_file_entries,
+    _iter_records
+)
 from ._io import Readable
-from ._object import ObjectGroup
+from ._match_cache import MatchCache
+from ._object import ObjectGroup, ObjectGroupRecord
 from ._rule import ObjectRule, match_object_group
+from ._rule_set import RuleSet, compile_rules
+from ._stats import MatchStats, current_stats
 
 
 __all__ = (
+    "iter_load",
+    "iter_load_file",
     "load",
+    "load_file"
 )
 
 
-def load(readable: Readable, rules: list[ObjectRule]) -> list[ObjectGroup]:
-    argument_groups = load_argument_groups(readable)
-    object_groups = [
-        match_object_group(group, rules) for group in argument_groups
-    ]
+def _match_entries(
+    entries: Iterator[_ArgumentEntry],
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool,
+    stats: MatchStats | None,
+    cache: MatchCache | None,
+    ambiguous: bool
+) -> Iterator[ObjectGroup | ObjectGroupRecord]:
+    rules = compile_rules(rules)
+
+    if stats is None:
+        stats = current_stats()
+
+    if stats is None:
+        for group in _iter_records(entries):
+            yield match_object_group(
+                group,
+                rules,
+                models=models,
+                cache=cache,
+                ambiguous=ambiguous
+            )
+
+        return
+
+    blocks = _iter_blocks(entries)
+
+    while True:
+        with stats.stage("tokenize"):
+            block = next(blocks, None)
+
+        if block is None:
+            return
+
+        with stats.stage("group"):
+            groups = _group_entries(block)
+
+        for group in groups:
+            with stats.stage("match"), stats:
+                result = match_object_group(
+                    group,
+                    rules,
+                    models=False,
+                    cache=cache,
+                    ambiguous=ambiguous
+                )
+
+            if models:
+                with stats.stage("models"):
+                    result = result.to_model()
+
+            yield result
+
+
+def iter_load(
+    readable: Readable,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    workers: int | None = None,
+    stats: MatchStats | None = None,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> Iterator[ObjectGroup | ObjectGroupRecord]:
+    if workers is not None and workers > 1:
+        if stats is not None or current_stats() is not None:
+            raise ValueError("Match statistics are not supported with workers")
+
+        if cache is not None:
+            raise ValueError("Match caches are not supported with workers")
+
+        if ambiguous:
+            raise ValueError(
+                "Ambiguous matching is not supported with workers"
+            )
+
+        from ._parallel import iter_load_parallel
+
+        yield from iter_load_parallel(readable, rules, workers, models=models)
+
+        return
+
+    yield from _match_entries(
+        _iter_entries(readable),
+        rules,
+        models,
+        stats,
+        cache,
+        ambiguous
+    )
+
+
+def load(
+    readable: Readable,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    workers: int | None = None,
+    stats: MatchStats | None = None,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> list[ObjectGroup] | list[ObjectGroupRecord]:
+    return list(
+        iter_load(
+            readable,
+            rules,
+            models=models,
+            workers=workers,
+            stats=stats,
+            cache=cache,
+            ambiguous=ambiguous
+        )
+    )
+
+
+def iter_load_file(
+    path: str | os.PathLike,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    stats: MatchStats | None = None,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> Iterator[ObjectGroup | ObjectGroupRecord]:
+    yield from _match_entries(
+        _iter_file_entries(path),
+        rules,
+        models,
+        stats,
+        cache,
+        ambiguous
+    )
+
 
-    return object_groups
+def load_file(
+    path: str | os.PathLike,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    stats: MatchStats | None = None,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> list[ObjectGroup] | list[ObjectGroupRecord]:
+    return list(
+        iter_load_file(
+            path,
+            rules,
+            models=models,
+            stats=stats,
+            cache=cache,
+            ambiguous=ambiguous
+        )
+    )
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import os
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait
+)
+from io import TextIOBase
+from time import perf_counter
+from typing import Iterable, Iterator, NamedTuple, Union
+
+from ._argument_load import iter_load as iter_load_argument_groups
+from ._io import Readable, get_stream
+from ._object import ObjectGroup, ObjectGroupRecord
+from ._rule import ObjectRule, match_object_group
+from ._rule_set import RuleSet, compile_rules
+
+
+__all__ = (
+    "LoadResult",
+    "Source",
+
+    "load_many"
+)
+
+
+Source = Union[str, os.PathLike, TextIOBase]
+
+
+class LoadResult(NamedTuple):
+    source: Source
+    value: list[ObjectGroup] | list[ObjectGroupRecord] | Exception
+    elapsed: float
+
+
+_CHUNK_LINES = 4096
+
+_PENDING_CHUNKS_PER_WORKER = 2
+
+_PENDING_SOURCES_PER_WORKER = 2
+
+
+_worker_rules: RuleSet | None = None
+
+
+def _initialize_worker(rules: list[ObjectRule]) -> None:
+    global _worker_rules
+
+    _worker_rules = RuleSet(rules)
+
+
+def _load_groups(
+    readable: Readable,
+    rules: RuleSet,
+    models: bool
+) -> list[ObjectGroup] | list[ObjectGroupRecord]:
+    return [
+        match_object_group(group, rules, models=models)
+        for group in iter_load_argument_groups(readable, models=False)
+    ]
+
+
+def _load_chunk(
+    text: str,
+    models: bool
+) -> list[ObjectGroup] | list[ObjectGroupRecord]:
+    return _load_groups(text, _worker_rules, models)
+
+
+def _load_source(
+    path: str | os.PathLike | None,
+    text: str | None,
+    rules: RuleSet,
+    models: bool
+) -> tuple[list[ObjectGroup] | list[ObjectGroupRecord] | Exception, float]:
+    start = perf_counter()
+
+    try:
+        if text is None:
+            with open(path, "r", encoding="utf-8") as stream:
+                value = _load_groups(stream, rules, models)
+        else:
+            value = _load_groups(text, rules, models)
+    except Exception as reason:
+        value = reason
+
+    return value, perf_counter() - start
+
+
+def _load_worker_source(
+    path: str | os.PathLike | None,
+    text: str | None,
+    models: bool
+) -> tuple[list[ObjectGroup] | list[ObjectGroupRecord] | Exception, float]:
+    return _load_source(path, text, _worker_rules, models)
+
+
+def _iter_chunks(readable: Readable, chunk_lines: int) -> Iterator[str]:
+    stream = get_stream(readable)
+    lines = []
+
+    while True:
+        text = stream.readline()
+
+        if not text:
+            break
+
+        is_top_level = text[0] not in (" ", "\t") and not text.isspace()
+
+        if is_top_level and len(lines) >= chunk_lines:
+            yield "".join(lines)
+
+            lines = []
+
+        lines.append(text)
+
+    if lines:
+        yield "".join(lines)
+
+
+def iter_load_parallel(
+    readable: Readable,
+    rules: Iterable[ObjectRule] | RuleSet,
+    workers: int,
+    models: bool = True
+) -> Iterator[ObjectGroup | ObjectGroupRecord]:
+    rules = compile_rules(rules)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(rules.rules,)
+    )
+    pending = deque()
+
+    try:
+        for chunk in _iter_chunks(readable, _CHUNK_LINES):
+            pending.append(executor.submit(_load_chunk, chunk, models))
+
+            if len(pending) >= workers * _PENDING_CHUNKS_PER_WORKER:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _prepare_source(
+    source: Source
+) -> tuple[str | os.PathLike | None, str | None]:
+    if isinstance(source, TextIOBase):
+        return None, source.read()
+
+    return source, None
+
+
+def load_many(
+    sources: Iterable[Source],
+    rules: Iterable[ObjectRule] | RuleSet,
+    workers: int | None = None,
+    models: bool = True
+) -> Iterator[LoadResult]:
+    rules = compile_rules(rules)
+
+    if workers == 1:
+        for source in sources:
+            path, text = _prepare_source(source)
+            value, elapsed = _load_source(path, text, rules, models)
+
+            yield LoadResult(source, value, elapsed)
+
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(rules.rules,)
+    )
+    limit = (workers or os.cpu_count() or 1) * _PENDING_SOURCES_PER_WORKER
+    sources = iter(sources)
+    pending: dict[Future, Source] = {}
+
+    try:
+        while True:
+            for source in sources:
+                future = executor.submit(
+                    _load_worker_source,
+                    *_prepare_source(source),
+                    models
+                )
+                pending[future] = source
+
+                if len(pending) >= limit:
+                    break
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                source = pending.pop(future)
+
+                try:
+                    value, elapsed = future.result()
+                except Exception as reason:
+                    value, elapsed = reason, 0.0
+
+                yield LoadResult(source, value, elapsed)
+    finally:
+        executor.shutdown(cancel_futures=True)
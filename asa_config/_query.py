@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import ipaddress
+
+from bisect import bisect_right
+from typing import Any, Iterable, NamedTuple, Union
+
+from ._index import ConfigIndex
+from ._object import ObjectGroup, ObjectGroupRecord
+
+
+__all__ = (
+    "AccessListQuery",
+    "Flow"
+)
+
+
+_Group = Union[ObjectGroup, ObjectGroupRecord]
+
+_Interval = tuple[int, int]
+
+
+_PORT_RANGE = (0, 65535)
+
+_IPV6_OFFSET = 1 << 32
+
+_UNBOUNDED = float("inf")
+
+
+class Flow(NamedTuple):
+    source: str
+    destination: str
+    protocol: str
+    destination_port: int | None = None
+    source_port: int | None = None
+
+
+def _address_key(value: str) -> int | None:
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError:
+        return None
+
+    if address.version == 4:
+        return int(address)
+
+    return _IPV6_OFFSET + int(address)
+
+
+def _merge(intervals: Iterable[_Interval]) -> list[_Interval]:
+    merged = []
+
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _port_intervals(value: Any) -> list[_Interval]:
+    if value is None or value.name == "object-group":
+        return [_PORT_RANGE]
+
+    properties = value.properties
+
+    if value.name == "eq":
+        return [(properties["value"], properties["value"])]
+
+    if value.name == "lt":
+        return [(0, properties["value"] - 1)]
+
+    if value.name == "gt":
+        return [(properties["value"] + 1, 65535)]
+
+    if value.name == "neq":
+        return [(0, properties["value"] - 1), (properties["value"] + 1, 65535)]
+
+    if value.name == "range":
+        return [(properties["start"], properties["stop"])]
+
+    return [_PORT_RANGE]
+
+
+def _contains(intervals: list[_Interval], value: int) -> bool:
+    index = bisect_right(intervals, (value, _UNBOUNDED)) - 1
+
+    return index >= 0 and value <= intervals[index][1]
+
+
+class _IntervalIndex:
+    __slots__ = ("points", "size", "nodes", "lines")
+
+    def __init__(self, intervals: list[list[_Interval]]):
+        keys: dict[tuple[_Interval, ...], int] = {}
+        self.lines: list[list[int]] = []
+
+        for line, line_intervals in enumerate(intervals):
+            key = tuple(line_intervals)
+            index = keys.get(key)
+
+            if index is None:
+                index = keys[key] = len(self.lines)
+                self.lines.append([])
+
+            self.lines[index].append(line)
+
+        self.points = sorted({
+            point
+            for key in keys
+            for start, end in key
+            for point in (start, end + 1)
+        })
+        self.size = len(self.points)
+        self.nodes: dict[int, list[int]] = {}
+
+        positions = {point: index for index, point in enumerate(self.points)}
+
+        for key, index in keys.items():
+            for start, end in key:
+                low = positions[start] + self.size
+                high = positions[end + 1] + self.size
+
+                while low < high:
+                    if low & 1:
+                        self.nodes.setdefault(low, []).append(index)
+                        low += 1
+
+                    if high & 1:
+                        high -= 1
+                        self.nodes.setdefault(high, []).append(index)
+
+                    low >>= 1
+                    high >>= 1
+
+    def lookup(self, value: int) -> list[int]:
+        index = bisect_right(self.points, value) - 1
+
+        if index < 0:
+            return []
+
+        lines = []
+        node = index + self.size
+
+        while node:
+            for key in self.nodes.get(node, ()):
+                lines.extend(self.lines[key])
+
+            node >>= 1
+
+        lines.sort()
+
+        return lines
+
+
+class _CompiledAccessList:
+    __slots__ = (
+        "entries",
+        "protocols",
+        "sources",
+        "destinations",
+        "source_ports",
+        "destination_ports",
+        "source_index",
+        "destination_index"
+    )
+
+    def __init__(self, entries: list[_Group], resolve):
+        self.entries = entries
+        self.protocols: list[str | None] = []
+        self.sources: list[list[_Interval]] = []
+        self.destinations: list[list[_Interval]] = []
+        self.source_ports: list[list[_Interval]] = []
+        self.destination_ports: list[list[_Interval]] = []
+
+        for entry in entries:
+            properties = entry.root.properties
+
+            if properties.get("type") is None or \
+                    properties.get("inactive") is not None:
+                self.protocols.append(None)
+                self.sources.append([])
+                self.destinations.append([])
+                self.source_ports.append([])
+                self.destination_ports.append([])
+
+                continue
+
+            self.protocols.append(properties["protocol"].lower())
+            self.sources.append(resolve(properties["source_address"]))
+            self.destinations.append(
+                resolve(properties["destination_address"])
+            )
+            self.source_ports.append(
+                _merge(_port_intervals(properties["source_port"]))
+            )
+            self.destination_ports.append(
+                _merge(_port_intervals(properties["destination_port"]))
+            )
+
+        self.source_index = _IntervalIndex(self.sources)
+        self.destination_index = _IntervalIndex(self.destinations)
+
+    def match(self, flow: Flow) -> list[int]:
+        source = _address_key(flow.source)
+        destination = _address_key(flow.destination)
+
+        if source is None or destination is None:
+            raise ValueError(f"Invalid flow address in {flow!r}")
+
+        protocol = flow.protocol.lower()
+        sources = self.source_index.lookup(source)
+        destinations = self.destination_index.lookup(destination)
+
+        if len(destinations) < len(sources):
+            candidates = destinations
+            others, value = self.sources, source
+        else:
+            candidates = sources
+            others, value = self.destinations, destination
+
+        return [
+            line for line in candidates
+            if self.protocols[line] == protocol
+            and _contains(others[line], value)
+            and (
+                flow.destination_port is None
+                or _contains(
+                    self.destination_ports[line],
+                    flow.destination_port
+                )
+            )
+            and (
+                flow.source_port is None
+                or _contains(self.source_ports[line], flow.source_port)
+            )
+        ]
+
+
+class AccessListQuery:
+    def __init__(self, groups: Iterable[_Group] | ConfigIndex):
+        if not isinstance(groups, ConfigIndex):
+            groups = ConfigIndex(groups)
+
+        self.index = groups
+
+        self._addresses: dict[tuple[str, str], list[_Interval]] = {}
+        self._access_lists: dict[str, _CompiledAccessList] = {}
+
+    def _resolve_reference(
+        self,
+        key: tuple[str, str],
+        visiting: set[tuple[str, str]]
+    ) -> list[_Interval]:
+        intervals = self._addresses.get(key)
+
+        if intervals is not None:
+            return intervals
+
+        if key in visiting:
+            return []
+
+        visiting.add(key)
+        intervals = []
+        group = self.index.get(*key)
+
+        if group is not None and key[0] == "object":
+            for child in group.children:
+                if child.root.name != "host":
+                    continue
+
+                address = _address_key(child.root.properties["value"])
+
+                if address is not None:
+                    intervals.append((address, address))
+        elif group is not None:
+            for member in self.index.members(key[1]):
+                root = member.root
+                intervals.extend(
+                    self._resolve_reference(
+                        (root.name, root.properties["name"]),
+                        visiting
+                    )
+                )
+
+        visiting.discard(key)
+        intervals = self._addresses[key] = _merge(intervals)
+
+        return intervals
+
+    def _resolve(self, value: Any) -> list[_Interval]:
+        if value is None:
+            return []
+
+        name = value.properties.get("name")
+
+        if value.name not in ("object", "object-group") or \
+                not isinstance(name, str):
+            return []
+
+        return self._resolve_reference((value.name, name), set())
+
+    def _compile(self, name: str) -> _CompiledAccessList:
+        compiled = self._access_lists.get(name)
+
+        if compiled is None:
+            compiled = self._access_lists[name] = _CompiledAccessList(
+                self.index.access_list(name),
+                self._resolve
+            )
+
+        return compiled
+
+    def match(self, name: str, flow: Flow) -> list[_Group]:
+        return self.match_many(name, [flow])[0]
+
+    def match_many(
+        self,
+        name: str,
+        flows: Iterable[Flow]
+    ) -> list[list[_Group]]:
+        compiled = self._compile(name)
+        entries = compiled.entries
+        results = []
+
+        for flow in flows:
+            results.append([entries[line] for line in compiled.match(flow)])
+
+        return results
+
+    def first_match(self, name: str, flow: Flow) -> _Group | None:
+        compiled = self._compile(name)
+        lines = compiled.match(flow)
+
+        if not lines:
+            return None
+
+        return compiled.entries[lines[0]]
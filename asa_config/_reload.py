@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+
+from typing import Iterable, Iterator
+
+from ._argument_load import (
+    _ArgumentEntry,
+    _group_entries,
+    _iter_blocks,
+    _iter_entries
+)
+from ._io import Readable
+from ._object import ObjectGroup, ObjectGroupRecord
+from ._rule import ObjectRule, match_object_group
+from ._rule_set import RuleSet, compile_rules
+
+
+__all__ = (
+    "ReloadResult",
+
+    "reload"
+)
+
+
+def _digest_block(block: list[_ArgumentEntry]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+
+    for entry in block:
+        line = "\0".join(entry.arguments)
+        digest.update(f"{entry.indentation_level}\0{line}\n".encode("utf-8"))
+
+    return digest.digest()
+
+
+def _same_rules(
+    rule_set: RuleSet,
+    rules: Iterable[ObjectRule] | RuleSet
+) -> bool:
+    if isinstance(rules, RuleSet):
+        return rules is rule_set
+
+    rules = list(rules)
+
+    return len(rules) == len(rule_set.rules) and all(
+        rule is previous for rule, previous in zip(rules, rule_set.rules)
+    )
+
+
+class ReloadResult:
+    def __init__(
+        self,
+        groups: list[ObjectGroup] | list[ObjectGroupRecord],
+        digests: list[bytes],
+        rules: RuleSet,
+        models: bool,
+        reused: int = 0
+    ):
+        self.groups = groups
+        self.digests = digests
+        self.rules = rules
+        self.models = models
+        self.reused = reused
+
+    def __iter__(self) -> Iterator[ObjectGroup | ObjectGroupRecord]:
+        return iter(self.groups)
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __getitem__(self, index):
+        return self.groups[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ReloadResult):
+            return self.groups == other.groups
+
+        if isinstance(other, list):
+            return self.groups == other
+
+        return NotImplemented
+
+    @property
+    def matched(self) -> int:
+        return len(self.groups) - self.reused
+
+
+def reload(
+    previous: ReloadResult | list | None,
+    readable: Readable,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True
+) -> ReloadResult:
+    """Parse ``readable``, reusing unchanged blocks from ``previous``.
+
+    Only a ``ReloadResult`` from an earlier ``reload()`` carries the
+    block digests needed for reuse. ``None`` or a plain list, such as
+    the result of ``load()``, is accepted but every block is matched
+    again.
+    """
+    if not isinstance(previous, (ReloadResult, list, type(None))):
+        raise TypeError(
+            "previous must be a ReloadResult, a list or None, not "
+            f"{type(previous).__name__}"
+        )
+
+    known: dict[bytes, list[ObjectGroup | ObjectGroupRecord]] = {}
+
+    if isinstance(previous, ReloadResult) and previous.models == models \
+            and _same_rules(previous.rules, rules):
+        rules = previous.rules
+
+        for digest, group in zip(previous.digests, previous.groups):
+            known.setdefault(digest, []).append(group)
+
+    rules = compile_rules(rules)
+    groups = []
+    digests = []
+    reused = 0
+
+    for block in _iter_blocks(_iter_entries(readable)):
+        digest = _digest_block(block)
+        candidates = known.get(digest)
+
+        if candidates:
+            group = candidates.pop(0)
+            reused += 1
+        else:
+            [argument_group] = _group_entries(block)
+            group = match_object_group(argument_group, rules, models)
+
+        groups.append(group)
+        digests.append(digest)
+
+    return ReloadResult(groups, digests, rules, models, reused)
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import Any, Generator, Union
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+    Union
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
-from ._argument import ArgumentGroup
-from ._object import Object, ObjectGroup
-from ._decision import decision_tree
+from ._argument import ArgumentGroup, ArgumentGroupRecord
+from ._object import (
+    Object,
+    ObjectGroup,
+    ObjectGroupRecord,
+    ObjectRecord,
+    _resolve,
+    _TextSpan
+)
+from ._decision import Memo, match_sequence
+from ._match_cache import MatchCache
+from ._rule_set import RuleSet, compile_rules
+from ._stats import RuleStats, current_stats
 
 
 __all__ = (
+    "FirstMatch",
+    "Heads",
     "IntegerRule",
     "LiteralRule",
     "Matcher",
     "MatchError",
     "MatchGenerator",
+    "OffsetMatchGenerator",
     "NoneRule",
     "Object",
     "ObjectRule",
@@ -34,139 +55,411 @@ __all__ = (
 
 MatchGenerator = Generator[tuple[Any, list[str]], None, None]
 
+OffsetMatchGenerator = Generator[tuple[Any, int], None, None]
+
+FirstMatch = Union[tuple[Any, int], None]
+
+Heads = tuple[frozenset[str], frozenset[str]]
+
+
+_MAX_WIDTHS = 16
+
+
+def _add_widths(
+    left: frozenset[int] | None,
+    right: frozenset[int] | None
+) -> frozenset[int] | None:
+    if left is None or right is None:
+        return None
+
+    widths = frozenset(a + b for a in left for b in right)
+
+    if len(widths) > _MAX_WIDTHS:
+        return None
+
+    return widths
+
+
+def _sequence_widths(rules: list[Rule]) -> frozenset[int] | None:
+    if not rules:
+        return frozenset()
+
+    widths = frozenset((0,))
+
+    for rule in rules:
+        widths = _add_widths(widths, rule.widths())
+
+    return widths
+
+
+def _match_first_sequence(
+    rules: Sequence[Rule],
+    tokens: Sequence[str],
+    start: int,
+    observers: Sequence[RuleStats] | None = None
+) -> FirstMatch:
+    values = []
+
+    for index, rule in enumerate(rules):
+        if observers is None:
+            result = rule.match_first(tokens, start)
+        else:
+            stats = observers[index]
+            stats.attempts += 1
+            begin = perf_counter()
+            result = rule.match_first(tokens, start)
+            stats.seconds += perf_counter() - begin
+
+            if result is not None:
+                stats.successes += 1
+
+        if result is None:
+            return None
+
+        value, start = result
+        values.append(value)
+
+    return tuple(values), start
+
 
 class Matcher:
     def match(self, arguments: list[str]) -> MatchGenerator:
+        matched = False
+
+        for value, end in self.match_at(arguments, 0):
+            matched = True
+
+            yield _resolve(value), arguments[end:]
+
+        if not matched:
+            raise MatchError
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
         raise NotImplementedError
 
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        return next(self.match_at(tokens, start), None)
+
+    def heads(self) -> Heads | None:
+        return None
+
+    def widths(self) -> frozenset[int] | None:
+        return None
+
 
 class MatchError(Exception):
     pass
 
 
-def _wrap_matcher(matcher: Matcher):
-    def wrapped(arguments: list[str]):
+class IntegerRule(BaseModel, Matcher):
+    model_config = ConfigDict(defer_build=True)
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        if start >= len(tokens):
+            return
+
         try:
-            for item in matcher.match(arguments):
-                yield item, (item[1],), {}
-        except MatchError:
-            pass
+            value = int(tokens[start])
+        except ValueError:
+            return
 
-    return wrapped
+        yield value, start + 1
 
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if start >= len(tokens):
+            return None
 
-class IntegerRule(BaseModel, Matcher):
-    def match(self, arguments: list[str]) -> MatchGenerator:
         try:
-            value, *rest = arguments
-            value = int(value)
-        except ValueError as reason:
-            raise MatchError from reason
+            return int(tokens[start]), start + 1
+        except ValueError:
+            return None
 
-        yield value, rest
+    def widths(self) -> frozenset[int] | None:
+        return frozenset((1,))
 
 
 class LiteralRule(BaseModel, Matcher):
+    model_config = ConfigDict(defer_build=True)
+
     value: str
 
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        try:
-            value, *rest = arguments
-        except ValueError as reason:
-            raise MatchError from reason
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        if start >= len(tokens):
+            return
+
+        value = tokens[start]
 
         if value.lower() != self.value.lower():
-            raise MatchError
+            return
+
+        yield value, start + 1
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if start >= len(tokens):
+            return None
+
+        value = tokens[start]
+
+        if value.lower() != self.value.lower():
+            return None
+
+        return value, start + 1
+
+    def heads(self) -> Heads | None:
+        return frozenset(), frozenset((self.value.lower(),))
 
-        yield value, rest
+    def widths(self) -> frozenset[int] | None:
+        return frozenset((1,))
 
 
 class ObjectRuleProperty(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     value: Rule
 
 
 class ObjectRule(BaseModel, Matcher):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     properties: list[ObjectRuleProperty]
     children: list[ObjectRule]
 
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        try:
-            name, *arguments = arguments
-        except ValueError as reason:
-            raise MatchError from reason
+    _names: tuple[str, ...] = PrivateAttr()
+    _matchers: tuple[Rule, ...] = PrivateAttr()
 
-        if name != self.name:
-            raise MatchError
+    def model_post_init(self, context: Any) -> None:
+        self._bind_properties()
+
+    def _bind_properties(self) -> None:
+        self._names = tuple(prop.name for prop in self.properties)
+        self._matchers = tuple(prop.value for prop in self.properties)
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        if start >= len(tokens) or tokens[start] != self.name:
+            return
+
+        stats = current_stats()
+        observers = None
+
+        if stats is not None:
+            observers = [
+                stats.rule(self.name, prop.name) for prop in self.properties
+            ]
+
+        for values, end in match_sequence(
+            self._matchers,
+            tokens,
+            start + 1,
+            memo,
+            observers
+        ):
+            yield ObjectRecord._lazy(self.name, self._names, values), end
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if start >= len(tokens) or tokens[start] != self.name or \
+                not self._matchers:
+            return None
+
+        stats = current_stats()
+        observers = None
+
+        if stats is not None:
+            observers = [stats.rule(self.name, name) for name in self._names]
+
+        values = _match_first_sequence(
+            self._matchers,
+            tokens,
+            start + 1,
+            observers
+        )
+
+        if values is None:
+            return None
+
+        values, end = values
 
-        matchers = [_wrap_matcher(prop.value) for prop in self.properties]
+        return ObjectRecord._lazy(self.name, self._names, values), end
 
-        for decision in decision_tree(matchers)(arguments):
-            properties = OrderedDict()
-            rest = None
+    def heads(self) -> Heads | None:
+        if not self.properties:
+            return frozenset(), frozenset()
 
-            for prop, (value, rest) in zip(self.properties, decision):
-                properties[prop.name] = value
+        return frozenset((self.name,)), frozenset()
 
-            yield Object(name=self.name, properties=properties), rest
+    def widths(self) -> frozenset[int] | None:
+        return _add_widths(
+            frozenset((1,)),
+            _sequence_widths([prop.value for prop in self.properties])
+        )
 
 
 class StringRule(BaseModel, Matcher):
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        try:
-            value, *rest = arguments
-        except ValueError as reason:
-            raise MatchError from reason
+    model_config = ConfigDict(defer_build=True)
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        if start >= len(tokens):
+            return
+
+        yield tokens[start], start + 1
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if start >= len(tokens):
+            return None
 
-        yield value, rest
+        return tokens[start], start + 1
+
+    def widths(self) -> frozenset[int] | None:
+        return frozenset((1,))
 
 
 class TextRule(BaseModel, Matcher):
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        if not arguments:
-            raise MatchError
+    model_config = ConfigDict(defer_build=True)
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        if start >= len(tokens):
+            return
 
-        yield " ".join(arguments), []
+        yield _TextSpan(tokens, start), len(tokens)
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if start >= len(tokens):
+            return None
+
+        return _TextSpan(tokens, start), len(tokens)
 
 
 class TupleRule(BaseModel, Matcher):
+    model_config = ConfigDict(defer_build=True)
+
     values: list[Rule]
 
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        matchers = [_wrap_matcher(rule) for rule in self.values]
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        yield from match_sequence(self.values, tokens, start, memo)
 
-        for decision in decision_tree(matchers)(arguments):
-            result = []
-            rest = None
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        if not self.values:
+            return None
 
-            for value, rest in decision:
-                result.append(value)
+        return _match_first_sequence(self.values, tokens, start)
 
-            yield tuple(result), rest
+    def heads(self) -> Heads | None:
+        if not self.values:
+            return frozenset(), frozenset()
+
+        return self.values[0].heads()
+
+    def widths(self) -> frozenset[int] | None:
+        return _sequence_widths(self.values)
 
 
 class UnionRule(BaseModel, Matcher):
+    model_config = ConfigDict(defer_build=True)
+
     values: list[Rule]
 
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        error = None
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        for rule in self.values:
+            yield from rule.match_at(tokens, start, memo)
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        for rule in self.values:
+            result = rule.match_first(tokens, start)
+
+            if result is not None:
+                return result
+
+        return None
+
+    def heads(self) -> Heads | None:
+        exact = set()
+        folded = set()
+
+        for rule in self.values:
+            heads = rule.heads()
+
+            if heads is None:
+                return None
+
+            exact.update(heads[0])
+            folded.update(heads[1])
+
+        return frozenset(exact), frozenset(folded)
+
+    def widths(self) -> frozenset[int] | None:
+        widths = set()
 
         for rule in self.values:
-            try:
-                yield from rule.match(arguments)
+            value = rule.widths()
 
-                error = None
-            except MatchError as reason:
-                error = reason
+            if value is None:
+                return None
 
-        if error:
-            raise error
+            widths.update(value)
+
+        if len(widths) > _MAX_WIDTHS:
+            return None
+
+        return frozenset(widths)
 
 
 class NoneRule(BaseModel, Matcher):
-    def match(self, arguments: list[str]) -> MatchGenerator:
-        yield None, arguments
+    model_config = ConfigDict(defer_build=True)
+
+    def match_at(
+        self,
+        tokens: Sequence[str],
+        start: int,
+        memo: Memo | None = None
+    ) -> OffsetMatchGenerator:
+        yield None, start
+
+    def match_first(self, tokens: Sequence[str], start: int) -> FirstMatch:
+        return None, start
+
+    def widths(self) -> frozenset[int] | None:
+        return frozenset((0,))
 
 
 OptionalRule = lambda value: UnionRule(values=[value, NoneRule()])
@@ -184,31 +477,153 @@ Rule = Union[
 ]
 
 
-def match_object(
+def _match_complete(
+    rule: ObjectRule,
+    match_first: Callable[[Sequence[str], int], FirstMatch],
     arguments: list[str],
-    rules: list[ObjectRule]
-) -> tuple[Object, ObjectRule]:
+    memo: Memo
+) -> tuple[ObjectRecord | None, ObjectRecord | None]:
+    end = len(arguments)
+    result = match_first(arguments, 0)
+
+    if result is not None and result[1] == end:
+        return result[0], None
+
+    partial = None
+
+    for value, offset in rule.match_at(arguments, 0, memo):
+        if offset == end:
+            return value, None
+
+        if partial is None:
+            partial = value
+
+    return None, partial
+
+
+def _match_object(
+    arguments: list[str],
+    rules: Iterable[ObjectRule] | RuleSet,
+    ambiguous: bool
+) -> tuple[ObjectRecord, ObjectRule]:
+    rule_set = None
+
+    if isinstance(rules, RuleSet):
+        rule_set = rules
+        rules = rules.select(arguments)
+
+    memo = {}
+    stats = current_stats()
+    fallback = None
+
     for rule in rules:
-        try:
-            result, _ = next(rule.match(arguments))
+        if stats is not None:
+            rule_stats = stats.rule(rule.name)
+            rule_stats.attempts += 1
+            start = perf_counter()
+
+        if ambiguous:
+            result = next(rule.match_at(arguments, 0, memo), None)
+            record = None if result is None else result[0]
+        else:
+            if rule_set is None or stats is not None:
+                match_first = rule.match_first
+            else:
+                match_first = rule_set.matcher(rule)
+
+            record, partial = _match_complete(
+                rule,
+                match_first,
+                arguments,
+                memo
+            )
 
-            return result, rule
-        except (MatchError, StopIteration):
-            continue
+            if fallback is None and partial is not None:
+                fallback = partial, rule
+
+        if stats is not None:
+            rule_stats.seconds += perf_counter() - start
+
+            if record is not None:
+                rule_stats.successes += 1
+
+        if record is not None:
+            return record, rule
+
+    if fallback is not None:
+        if stats is not None:
+            stats.rule(fallback[1].name).successes += 1
+
+        return fallback
 
     raise MatchError
 
 
-def match_object_group(
-    argument_group: ArgumentGroup,
-    rules: list[ObjectRule]
-) -> ObjectGroup:
-    root, rule = match_object(argument_group.root, rules)
-
-    return ObjectGroup(
-        root=root,
-        children=[
-            match_object_group(child, rule.children)
+def match_object(
+    arguments: list[str],
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> tuple[Object | ObjectRecord, ObjectRule]:
+    if cache is not None and isinstance(rules, RuleSet):
+        key = (rules, ambiguous, tuple(arguments))
+        value = cache.get(key)
+
+        if value is None:
+            value = _match_object(arguments, rules, ambiguous)
+            cache.put(key, value)
+
+        result, rule = value
+        result = result._copy()
+    else:
+        result, rule = _match_object(arguments, rules, ambiguous)
+
+    if models:
+        result = result.to_model()
+
+    return result, rule
+
+
+def _match_record(
+    argument_group: ArgumentGroup | ArgumentGroupRecord,
+    rules: RuleSet,
+    cache: MatchCache | None,
+    ambiguous: bool
+) -> ObjectGroupRecord:
+    root, rule = match_object(
+        argument_group.root,
+        rules,
+        models=False,
+        cache=cache,
+        ambiguous=ambiguous
+    )
+    children = rules.children(rule)
+
+    return ObjectGroupRecord(
+        root,
+        [
+            _match_record(child, children, cache, ambiguous)
             for child in argument_group.children
         ]
     )
+
+
+def match_object_group(
+    argument_group: ArgumentGroup | ArgumentGroupRecord,
+    rules: Iterable[ObjectRule] | RuleSet,
+    models: bool = True,
+    cache: MatchCache | None = None,
+    ambiguous: bool = False
+) -> ObjectGroup | ObjectGroupRecord:
+    record = _match_record(
+        argument_group,
+        compile_rules(rules),
+        cache,
+        ambiguous
+    )
+
+    if models:
+        return record.to_model()
+
+    return record
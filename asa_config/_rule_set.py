@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from ._codegen import CompiledMatcher
+    from ._rule import ObjectRule
+
+
+__all__ = (
+    "RuleSet",
+
+    "compile_rules"
+)
+
+
+_MAX_GUARD_OFFSETS = 8
+
+
+_Guard = tuple[tuple[int, ...], frozenset[str], frozenset[str]]
+
+
+def _compile_guards(rule: ObjectRule) -> tuple[_Guard, ...]:
+    guards = []
+    offsets = {1}
+
+    for prop in rule.properties:
+        heads = prop.value.heads()
+
+        if heads is not None:
+            exact, folded = heads
+            guards.append((tuple(sorted(offsets)), exact, folded))
+
+        widths = prop.value.widths()
+
+        if widths is None:
+            break
+
+        offsets = {
+            offset + width for offset in offsets for width in widths
+        }
+
+        if not offsets or len(offsets) > _MAX_GUARD_OFFSETS:
+            break
+
+    return tuple(guards)
+
+
+def _check_guards(
+    guards: tuple[_Guard, ...],
+    arguments: list[str]
+) -> bool:
+    count = len(arguments)
+
+    for offsets, exact, folded in guards:
+        for offset in offsets:
+            if offset >= count:
+                continue
+
+            argument = arguments[offset]
+
+            if argument in exact or argument.lower() in folded:
+                break
+        else:
+            return False
+
+    return True
+
+
+class RuleSet:
+    def __init__(self, rules: Iterable[ObjectRule], compiled: bool = True):
+        self.rules = list(rules)
+        self.compiled = compiled
+
+        self._index: dict[str, list[tuple[ObjectRule, tuple[_Guard, ...]]]]
+        self._index = {}
+        self._children: dict[int, RuleSet] = {}
+        self._matchers: dict[int, CompiledMatcher] = {}
+
+        for rule in self.rules:
+            candidates = self._index.setdefault(rule.name, [])
+            candidates.append((rule, _compile_guards(rule)))
+
+            if id(rule) not in self._children:
+                self._children[id(rule)] = RuleSet(rule.children, compiled)
+
+    def __reduce__(self):
+        return RuleSet, (self.rules, self.compiled)
+
+    def __iter__(self) -> Iterator[ObjectRule]:
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def children(self, rule: ObjectRule) -> RuleSet:
+        return self._children[id(rule)]
+
+    def matcher(self, rule: ObjectRule) -> CompiledMatcher:
+        if not self.compiled:
+            return rule.match_first
+
+        matcher = self._matchers.get(id(rule))
+
+        if matcher is None:
+            from ._codegen import compile_matcher
+
+            matcher = self._matchers[id(rule)] = compile_matcher(rule)
+
+        return matcher
+
+    def select(self, arguments: list[str]) -> Iterator[ObjectRule]:
+        if not arguments:
+            return
+
+        for rule, guards in self._index.get(arguments[0], ()):
+            if _check_guards(guards, arguments):
+                yield rule
+
+
+def compile_rules(rules: Iterable[ObjectRule] | RuleSet) -> RuleSet:
+    if isinstance(rules, RuleSet):
+        return rules
+
+    return RuleSet(rules)
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, Sequence, Union
+
+from ._object import Object, ObjectGroup, ObjectGroupRecord, ObjectRecord
+
+
+__all__ = (
+    "Snapshot",
+    "SnapshotError",
+    "SnapshotGroup",
+    "SnapshotObject",
+
+    "dump_snapshot",
+    "load_snapshot"
+)
+
+
+_MAGIC = b"ASAS"
+
+_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIIIIII")
+
+_VALUE_FIELDS = 2
+
+_PROPERTY_FIELDS = 3
+
+_OBJECT_FIELDS = 3
+
+_GROUP_FIELDS = 3
+
+_INTEGER_RANGE = range(-(1 << 31), 1 << 31)
+
+_NONE, _STRING, _INTEGER, _OBJECT, _TUPLE, _LARGE_INTEGER = range(6)
+
+
+_Group = Union[ObjectGroup, ObjectGroupRecord, "SnapshotGroup"]
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _to_bytes(table: array) -> bytes:
+    if sys.byteorder == "big":
+        table = array(table.typecode, table)
+        table.byteswap()
+
+    return table.tobytes()
+
+
+class _Writer:
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        self.values = array("i")
+        self.properties = array("i")
+        self.objects = array("i")
+        self.groups = array("i")
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+
+        return index
+
+    def value(self, value: Any) -> tuple[int, int]:
+        if value is None:
+            return _NONE, 0
+
+        if isinstance(value, str):
+            return _STRING, self.string(value)
+
+        if isinstance(value, int) and not isinstance(value, bool):
+            if value in _INTEGER_RANGE:
+                return _INTEGER, value
+
+            return _LARGE_INTEGER, self.string(str(value))
+
+        if isinstance(value, tuple):
+            items = [self.value(item) for item in value]
+            first = len(self.values) // _VALUE_FIELDS
+
+            for item in items:
+                self.values.extend(item)
+
+            return _TUPLE | len(items) << 8, first
+
+        if isinstance(value, (Object, ObjectRecord, SnapshotObject)):
+            return _OBJECT, self.object(value)
+
+        raise SnapshotError(f"Cannot store {type(value).__name__} values")
+
+    def object(self, value: Object | ObjectRecord | SnapshotObject) -> int:
+        properties = [
+            (self.string(name), *self.value(item))
+            for name, item in value.properties.items()
+        ]
+        first = len(self.properties) // _PROPERTY_FIELDS
+
+        for record in properties:
+            self.properties.extend(record)
+
+        self.objects.extend((self.string(value.name), first, len(properties)))
+
+        return len(self.objects) // _OBJECT_FIELDS - 1
+
+    def write(self, groups: list[_Group], stream) -> None:
+        nodes = list(groups)
+        index = 0
+
+        while index < len(nodes):
+            group = nodes[index]
+            first = len(nodes)
+            nodes.extend(group.children)
+            self.groups.extend(
+                (self.object(group.root), first, len(group.children))
+            )
+
+            index += 1
+
+        offsets = array("i", [0])
+        blob = bytearray()
+
+        for value in self.strings:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+
+        stream.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                0,
+                len(self.strings),
+                len(blob),
+                len(self.values) // _VALUE_FIELDS,
+                len(self.properties) // _PROPERTY_FIELDS,
+                len(self.objects) // _OBJECT_FIELDS,
+                len(self.groups) // _GROUP_FIELDS,
+                len(groups)
+            )
+        )
+        stream.write(_to_bytes(offsets))
+        stream.write(blob)
+
+        position = _HEADER.size + offsets.itemsize * len(offsets) + len(blob)
+        stream.write(bytes(_align(position) - position))
+
+        for table in (self.values, self.properties, self.objects, self.groups):
+            stream.write(_to_bytes(table))
+
+
+def dump_snapshot(groups: Iterable[_Group], path: str | os.PathLike) -> None:
+    groups = list(groups)
+    temporary = f"{os.fspath(path)}.tmp"
+
+    try:
+        with open(temporary, "wb") as stream:
+            _Writer().write(groups, stream)
+
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+
+        raise
+
+
+class SnapshotObject:
+    __slots__ = ("_snapshot", "_index", "_properties")
+
+    def __init__(self, snapshot: Snapshot, index: int):
+        self._snapshot = snapshot
+        self._index = index
+        self._properties = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SnapshotObject, ObjectRecord)):
+            return self.name == other.name and \
+                list(self.properties.items()) == \
+                list(other.properties.items())
+
+        if isinstance(other, Object):
+            return self.to_model() == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SnapshotObject(name={self.name!r}, " \
+            f"properties={self.properties!r})"
+
+    @property
+    def name(self) -> str:
+        snapshot = self._snapshot
+
+        return snapshot._string(
+            snapshot._objects[self._index * _OBJECT_FIELDS]
+        )
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        if self._properties is None:
+            snapshot = self._snapshot
+            string = snapshot._string
+            value = snapshot._value
+            table = snapshot._properties
+            offset = self._index * _OBJECT_FIELDS
+            first = snapshot._objects[offset + 1] * _PROPERTY_FIELDS
+            end = first + snapshot._objects[offset + 2] * _PROPERTY_FIELDS
+
+            self._properties = {
+                string(table[index]): value(table[index + 1], table[index + 2])
+                for index in range(first, end, _PROPERTY_FIELDS)
+            }
+
+        return self._properties
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.properties.get(name, default)
+
+    def to_model(self) -> Object:
+        return Object.model_construct(
+            name=self.name,
+            properties=OrderedDict(
+                (name, _to_model(value))
+                for name, value in self.properties.items()
+            )
+        )
+
+
+class SnapshotGroup:
+    __slots__ = ("_snapshot", "_index")
+
+    def __init__(self, snapshot: Snapshot, index: int):
+        self._snapshot = snapshot
+        self._index = index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SnapshotGroup, ObjectGroupRecord)):
+            return self.root == other.root and self.children == other.children
+
+        if isinstance(other, ObjectGroup):
+            return self.to_model() == other
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SnapshotGroup(root={self.root!r}, " \
+            f"children={self.children!r})"
+
+    @property
+    def root(self) -> SnapshotObject:
+        return SnapshotObject(
+            self._snapshot,
+            self._snapshot._groups[self._index * _GROUP_FIELDS]
+        )
+
+    @property
+    def children(self) -> list[SnapshotGroup]:
+        snapshot = self._snapshot
+        offset = self._index * _GROUP_FIELDS
+        first = snapshot._groups[offset + 1]
+        count = snapshot._groups[offset + 2]
+
+        return [
+            SnapshotGroup(snapshot, index)
+            for index in range(first, first + count)
+        ]
+
+    def to_model(self) -> ObjectGroup:
+        return ObjectGroup.model_construct(
+            root=self.root.to_model(),
+            children=[child.to_model() for child in self.children]
+        )
+
+
+def _to_model(value: Any) -> Any:
+    if isinstance(value, SnapshotObject):
+        return value.to_model()
+
+    if isinstance(value, tuple):
+        return tuple(_to_model(item) for item in value)
+
+    return value
+
+
+class Snapshot:
+    def __init__(self, path: str | os.PathLike):
+        self._views: list[memoryview] = []
+
+        with open(path, "rb") as stream:
+            try:
+                self._buffer = mmap.mmap(
+                    stream.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+            except ValueError as error:
+                raise SnapshotError("Empty snapshot") from error
+
+        try:
+            self._read_header()
+        except SnapshotError:
+            self.close()
+
+            raise
+
+    def _table(self, start: int, count: int) -> Sequence[int]:
+        end = start + count * 4
+
+        if sys.byteorder == "big":
+            table = array("i")
+            table.frombytes(self._buffer[start:end])
+            table.byteswap()
+
+            return table
+
+        view = memoryview(self._buffer)[start:end]
+        table = view.cast("i")
+        self._views.extend((view, table))
+
+        return table
+
+    def _read_header(self) -> None:
+        buffer = self._buffer
+
+        if len(buffer) < _HEADER.size:
+            raise SnapshotError("Truncated snapshot header")
+
+        (
+            magic,
+            version,
+            _,
+            strings,
+            blob_size,
+            values,
+            properties,
+            objects,
+            groups,
+            roots
+        ) = _HEADER.unpack_from(buffer)
+
+        if magic != _MAGIC:
+            raise SnapshotError("Not an asa_config snapshot")
+
+        if version != _VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+
+        position = _HEADER.size
+        sizes = []
+
+        for count in (
+            strings + 1,
+            values * _VALUE_FIELDS,
+            properties * _PROPERTY_FIELDS,
+            objects * _OBJECT_FIELDS,
+            groups * _GROUP_FIELDS
+        ):
+            sizes.append((position, count))
+            position += count * 4
+
+            if len(sizes) == 1:
+                self._blob = position
+                position = _align(position + blob_size)
+
+        if position != len(buffer):
+            raise SnapshotError("Snapshot size does not match its header")
+
+        (
+            self._offsets,
+            self._values,
+            self._properties,
+            self._objects,
+            self._groups
+        ) = (self._table(start, count) for start, count in sizes)
+
+        self._strings: list[str | None] = [None] * strings
+        self._roots = roots
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._roots
+
+    def __getitem__(self, index: int) -> SnapshotGroup:
+        if index < 0:
+            index += self._roots
+
+        if not 0 <= index < self._roots:
+            raise IndexError(index)
+
+        return SnapshotGroup(self, index)
+
+    def __iter__(self) -> Iterator[SnapshotGroup]:
+        for index in range(self._roots):
+            yield SnapshotGroup(self, index)
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+
+        self._views.clear()
+        self._buffer.close()
+
+    def to_models(self) -> list[ObjectGroup]:
+        return [group.to_model() for group in self]
+
+    def _string(self, index: int) -> str:
+        value = self._strings[index]
+
+        if value is None:
+            start = self._blob + self._offsets[index]
+            end = self._blob + self._offsets[index + 1]
+            value = self._strings[index] = str(
+                self._buffer[start:end],
+                "utf-8"
+            )
+
+        return value
+
+    def _value(self, word: int, payload: int) -> Any:
+        kind = word & 0xff
+
+        if kind == _STRING:
+            return self._string(payload)
+
+        if kind == _INTEGER:
+            return payload
+
+        if kind == _OBJECT:
+            return SnapshotObject(self, payload)
+
+        if kind == _TUPLE:
+            values = self._values
+            first = payload * _VALUE_FIELDS
+            end = first + (word >> 8) * _VALUE_FIELDS
+
+            return tuple(
+                self._value(values[index], values[index + 1])
+                for index in range(first, end, _VALUE_FIELDS)
+            )
+
+        if kind == _LARGE_INTEGER:
+            return int(self._string(payload))
+
+        return None
+
+
+def load_snapshot(path: str | os.PathLike) -> Snapshot:
+    return Snapshot(path)
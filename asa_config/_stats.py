@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Iterator
+
+
+__all__ = (
+    "MatchStats",
+    "RuleStats",
+
+    "current_stats"
+)
+
+
+_current_stats: ContextVar[MatchStats | None] = ContextVar(
+    "asa_config_match_stats",
+    default=None
+)
+
+
+class RuleStats:
+    __slots__ = ("attempts", "successes", "backtracks", "seconds")
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.backtracks = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "backtracks": self.backtracks,
+            "seconds": self.seconds
+        }
+
+
+class MatchStats:
+    def __init__(self):
+        self.rules: dict[tuple[str, str | None], RuleStats] = {}
+        self.stages: dict[str, float] = {}
+        self._tokens = []
+
+    def __enter__(self) -> MatchStats:
+        self._tokens.append(_current_stats.set(self))
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current_stats.reset(self._tokens.pop())
+
+    def rule(self, name: str, property: str | None = None) -> RuleStats:
+        key = (name, property)
+        stats = self.rules.get(key)
+
+        if stats is None:
+            stats = self.rules[key] = RuleStats()
+
+        return stats
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + \
+                perf_counter() - start
+
+    def as_dict(self) -> dict[str, Any]:
+        rules = {}
+
+        for (name, property), stats in self.rules.items():
+            entry = rules.setdefault(
+                name,
+                {**RuleStats().as_dict(), "properties": {}}
+            )
+
+            if property is None:
+                entry.update(stats.as_dict())
+            else:
+                entry["properties"][property] = stats.as_dict()
+
+        return {"stages": dict(self.stages), "rules": rules}
+
+
+def current_stats() -> MatchStats | None:
+    return _current_stats.get()
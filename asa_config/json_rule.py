@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
 from enum import StrEnum, auto
 from pathlib import Path
-from typing import Annotated, Union, Literal
-
-import jsonref
+from typing import Annotated, Any, Hashable, Union, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    VERSION as PYDANTIC_VERSION,
+    BaseModel,
+    ConfigDict,
+    Field
+)
 
 from ._io import Readable, get_stream
 from ._rule import (
@@ -15,6 +24,7 @@ from ._rule import (
     ObjectRule,
     ObjectRuleProperty,
     OptionalRule,
+    Rule,
     StringRule,
     TextRule,
     TupleRule,
@@ -35,6 +45,7 @@ __all__ = (
     "JsonTupleRule",
     "JsonUnionRule",
 
+    "default_cache_directory",
     "load",
     "load_file",
     "load_all"
@@ -46,6 +57,8 @@ _DEFAULT_JSON_OBJECT_RULE_DIRECTORY = Path(__file__).parent.parent \
 
 _JSON_RULE_TYPE_ALIAS = "$type"
 
+_CACHE_FORMAT_VERSION = 3
+
 
 class JsonRuleType(StrEnum):
     INTEGER = auto()
@@ -59,6 +72,8 @@ class JsonRuleType(StrEnum):
 
 
 class JsonIntegerRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.INTEGER],
         Field(
@@ -72,6 +87,8 @@ class JsonIntegerRule(BaseModel):
 
 
 class JsonLiteralRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.LITERAL],
         Field(
@@ -87,6 +104,8 @@ class JsonLiteralRule(BaseModel):
 
 
 class JsonObjectRuleProperty(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     value: JsonRule
 
@@ -98,6 +117,8 @@ class JsonObjectRuleProperty(BaseModel):
 
 
 class JsonObjectRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.OBJECT],
         Field(
@@ -119,6 +140,8 @@ class JsonObjectRule(BaseModel):
 
 
 class JsonOptionalRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.OPTIONAL],
         Field(
@@ -134,6 +157,8 @@ class JsonOptionalRule(BaseModel):
 
 
 class JsonStringRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.STRING],
         Field(
@@ -147,6 +172,8 @@ class JsonStringRule(BaseModel):
 
 
 class JsonTextRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.TEXT],
         Field(
@@ -160,6 +187,8 @@ class JsonTextRule(BaseModel):
 
 
 class JsonTupleRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.TUPLE],
         Field(
@@ -175,6 +204,8 @@ class JsonTupleRule(BaseModel):
 
 
 class JsonUnionRule(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     type: Annotated[
         Literal[JsonRuleType.UNION],
         Field(
@@ -204,15 +235,45 @@ JsonRule = Annotated[
 ]
 
 
+def _intern(
+    rule: Rule | ObjectRuleProperty,
+    table: dict[Hashable, Any]
+) -> Any:
+    if isinstance(rule, ObjectRule):
+        rule.properties = [_intern(prop, table) for prop in rule.properties]
+        rule.children = [_intern(child, table) for child in rule.children]
+        rule._bind_properties()
+        key = (
+            ObjectRule,
+            rule.name,
+            tuple(id(prop) for prop in rule.properties),
+            tuple(id(child) for child in rule.children)
+        )
+    elif isinstance(rule, ObjectRuleProperty):
+        rule.value = _intern(rule.value, table)
+        key = (ObjectRuleProperty, rule.name, id(rule.value))
+    elif isinstance(rule, (TupleRule, UnionRule)):
+        rule.values = [_intern(value, table) for value in rule.values]
+        key = (type(rule), tuple(id(value) for value in rule.values))
+    elif isinstance(rule, LiteralRule):
+        key = (LiteralRule, rule.value)
+    else:
+        key = (type(rule),)
+
+    return table.setdefault(key, rule)
+
+
 def load(
     readable: Readable,
     base_uri: str | None = None
 ) -> ObjectRule:
+    import jsonref
+
     stream = get_stream(readable)
     data = jsonref.load(stream, base_uri=base_uri)
     rule = JsonObjectRule.model_validate(data).convert()
 
-    return rule
+    return _intern(rule, {})
 
 
 def load_file(file: Path) -> ObjectRule:
@@ -220,13 +281,84 @@ def load_file(file: Path) -> ObjectRule:
         return load(stream, base_uri=file.as_uri())
 
 
+def default_cache_directory() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+
+    if base:
+        return Path(base) / "asa_config"
+
+    return Path.home() / ".cache" / "asa_config"
+
+
+def _hash_directory(directory: Path, files: list[Path]) -> str:
+    digest = hashlib.sha256()
+    digest.update(
+        f"{_CACHE_FORMAT_VERSION}:{sys.version_info[:2]}:"
+        f"{PYDANTIC_VERSION}".encode()
+    )
+
+    for file in sorted(files):
+        digest.update(file.relative_to(directory).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+
+    return digest.hexdigest()
+
+
+def _read_cache(path: Path) -> list[ObjectRule] | None:
+    try:
+        with path.open("rb") as stream:
+            rules = pickle.load(stream)
+    except Exception:
+        return None
+
+    if not isinstance(rules, list):
+        return None
+
+    return rules
+
+
+def _write_cache(path: Path, rules: list[ObjectRule]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        descriptor, name = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=path.name,
+            suffix=".tmp"
+        )
+
+        try:
+            with os.fdopen(descriptor, "wb") as stream:
+                pickle.dump(rules, stream, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(name, path)
+        except BaseException:
+            os.unlink(name)
+
+            raise
+    except OSError:
+        pass
+
+
 def load_all(
-    directory: Path = _DEFAULT_JSON_OBJECT_RULE_DIRECTORY
+    directory: Path = _DEFAULT_JSON_OBJECT_RULE_DIRECTORY,
+    cache_directory: Path | None = None
 ) -> list[ObjectRule]:
     if not directory.is_dir() or not directory.exists():
         raise ValueError(f"'{directory}' is not an existing directory")
 
-    files = directory.glob("**/*.json")
+    files = list(directory.glob("**/*.json"))
+    cache = None
+
+    if cache_directory is not None:
+        digest = _hash_directory(directory, files)
+        cache = Path(cache_directory) / f"rules-{digest}.pickle"
+        rules = _read_cache(cache)
+
+        if rules is not None:
+            return rules
+
     rules = []
 
     for file in files:
@@ -236,4 +368,10 @@ def load_all(
         rule = load_file(file)
         rules.append(rule)
 
+    table = {}
+    rules = [_intern(rule, table) for rule in rules]
+
+    if cache is not None:
+        _write_cache(cache, rules)
+
     return rules
@@ -0,0 +1,62 @@
+from time import perf_counter
+
+import asa_config
+import asa_config.json_rule
+
+from asa_config._argument_load import _read_entries
+
+from .synthetic import generate_config
+
+
+def _timed(function, repeat: int = 3) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main(access_list_lines: int = 10_000):
+    rules = asa_config.json_rule.load_all()
+    compiled = asa_config.RuleSet(rules)
+    interpreted = asa_config.RuleSet(rules, compiled=False)
+    text = generate_config(
+        objects=access_list_lines // 10,
+        groups=access_list_lines // 50,
+        members=10,
+        access_list_lines=access_list_lines
+    )
+    arguments = [
+        entry.arguments
+        for entry in _read_entries(text)
+        if entry.arguments[0] == "access-list"
+    ]
+
+    def first_match(rule_set):
+        for line in arguments:
+            for rule in rule_set.select(line):
+                if rule_set.matcher(rule)(line, 0) is not None:
+                    break
+
+    timings = {
+        "first_match interpreted": _timed(lambda: first_match(interpreted)),
+        "first_match compiled": _timed(lambda: first_match(compiled)),
+        "load interpreted": _timed(
+            lambda: asa_config.load(text, interpreted, models=False)
+        ),
+        "load compiled": _timed(
+            lambda: asa_config.load(text, compiled, models=False)
+        )
+    }
+
+    print(f"{len(arguments)} access-list lines")
+
+    for name, seconds in timings.items():
+        print(f"{name:>24}: {seconds / len(arguments) * 1e6:8.2f} us/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import gc
+import tracemalloc
+
+import asa_config
+import asa_config.json_rule
+
+from .synthetic import generate_config
+
+
+def main(access_list_lines: int = 20_000):
+    rules = asa_config.RuleSet(asa_config.json_rule.load_all())
+    text = generate_config(
+        objects=0,
+        groups=access_list_lines // 50,
+        members=0,
+        access_list_lines=access_list_lines
+    )
+
+    tracemalloc.start()
+
+    groups = asa_config.load(text, rules)
+    gc.collect()
+    models, _ = tracemalloc.get_traced_memory()
+
+    table = asa_config.export_columns(groups, "access-list")
+    del groups
+    gc.collect()
+    columns, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    print(f"{len(table)} access-list entries, {len(table.columns)} columns")
+    print(f"   models: {models / len(table):8.1f} bytes/entry")
+    print(f"  columns: {columns / len(table):8.1f} bytes/entry")
+    print(f"    ratio: {models / columns:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from time import perf_counter
+
+from asa_config._argument import ArgumentGroupRecord
+from asa_config._argument_load import _ArgumentEntry, _group_entries
+
+
+def _recursive_group_entries(
+    entries: list[_ArgumentEntry],
+    current_indentation_level: int = 0
+) -> list[ArgumentGroupRecord]:
+    groups = []
+
+    if not entries:
+        return groups
+
+    current_entry = entries[0]
+    children = []
+    index = 1
+
+    def finalize():
+        groups.append(
+            ArgumentGroupRecord(
+                current_entry.arguments,
+                _recursive_group_entries(
+                    children,
+                    current_indentation_level + 1
+                )
+            )
+        )
+
+    while index < len(entries):
+        next_entry = entries[index]
+
+        if next_entry.indentation_level == current_indentation_level:
+            finalize()
+
+            children = []
+            current_entry = next_entry
+        else:
+            children.append(next_entry)
+
+        index += 1
+
+    finalize()
+
+    return groups
+
+
+def _generate(lines: int, depth: int) -> list[_ArgumentEntry]:
+    return [
+        _ArgumentEntry(["policy-map", str(index)], index % depth)
+        for index in range(lines)
+    ]
+
+
+def _timed(function, repeat: int = 3) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main(lines: int = 100_000):
+    print(f"{lines} lines")
+
+    for depth in (2, 8, 32, 128):
+        entries = _generate(lines, depth)
+        recursive = _timed(lambda: _recursive_group_entries(entries))
+        stack = _timed(lambda: _group_entries(entries))
+
+        print(
+            f"depth {depth:>3}: recursive {recursive * 1e3:8.1f} ms, "
+            f"single pass {stack * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
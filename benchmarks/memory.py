@@ -0,0 +1,92 @@
+import gc
+import os
+import resource
+import subprocess
+import sys
+
+import asa_config
+import asa_config.json_rule
+
+from asa_config import _argument_load
+from asa_config._argument_load import load
+
+from .synthetic import generate_config
+
+
+_STAGES = ("arguments", "objects")
+
+
+def _resident_size() -> int:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as stream:
+            pages = int(stream.read().split()[1])
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _measure(stage: str, interned: bool, access_list_lines: int) -> int:
+    if not interned:
+        _argument_load._MAX_INTERNED_TOKENS = 0
+
+    rules = asa_config.RuleSet(asa_config.json_rule.load_all())
+    text = generate_config(
+        objects=1000,
+        groups=200,
+        members=10,
+        access_list_lines=access_list_lines
+    )
+
+    gc.collect()
+    before = _resident_size()
+
+    if stage == "arguments":
+        result = load(text, models=False)
+    else:
+        result = asa_config.load(text, rules, models=False)
+
+    gc.collect()
+    after = _resident_size()
+
+    del result
+
+    return after - before
+
+
+def main(access_list_lines: int = 100_000):
+    print(f"{access_list_lines} access-list lines, resident size growth")
+
+    for stage in _STAGES:
+        sizes = {}
+
+        for interned in (False, True):
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.memory",
+                    "--child",
+                    stage,
+                    str(int(interned)),
+                    str(access_list_lines)
+                ],
+                capture_output=True,
+                check=True,
+                text=True
+            )
+            sizes[interned] = int(process.stdout)
+
+        print(
+            f"{stage:>10}: {sizes[False] / 1024 / 1024:8.1f} MiB -> "
+            f"{sizes[True] / 1024 / 1024:8.1f} MiB interned"
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        stage, interned, access_list_lines = sys.argv[2:5]
+
+        print(_measure(stage, interned == "1", int(access_list_lines)))
+    else:
+        main(*(int(argument) for argument in sys.argv[1:]))
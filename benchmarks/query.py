@@ -0,0 +1,49 @@
+import random
+
+from time import perf_counter
+
+import asa_config
+import asa_config.json_rule
+
+from .synthetic import generate_config
+
+
+def main(access_list_lines: int = 20_000, flows: int = 10_000):
+    rules = asa_config.RuleSet(asa_config.json_rule.load_all())
+    text = generate_config(
+        objects=2000,
+        groups=200,
+        members=20,
+        access_list_lines=access_list_lines,
+        access_lists=10
+    )
+    groups = asa_config.load(text, rules, models=False)
+    generator = random.Random(0)
+    batch = [
+        asa_config.Flow(
+            f"10.0.{generator.randrange(8)}.{generator.randrange(256)}",
+            f"10.0.{generator.randrange(8)}.{generator.randrange(256)}",
+            generator.choice(("tcp", "udp")),
+            generator.choice((22, 53, 443, 8080))
+        )
+        for _ in range(flows)
+    ]
+
+    start = perf_counter()
+    query = asa_config.AccessListQuery(groups)
+    query.match("ACL_0", batch[0])
+    compiled = perf_counter() - start
+
+    start = perf_counter()
+    results = query.match_many("ACL_0", batch)
+    queried = perf_counter() - start
+
+    entries = len(query.index.access_list("ACL_0"))
+
+    print(f"{entries} entries, {flows} flows, {sum(map(len, results))} hits")
+    print(f"  compile: {compiled * 1e3:8.1f} ms")
+    print(f"    query: {queried / flows * 1e6:8.2f} us/flow")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from time import perf_counter
+
+import asa_config
+import asa_config.json_rule
+
+from asa_config import (
+    ArgumentGroup,
+    Object,
+    ObjectGroup,
+    ObjectGroupRecord,
+    ObjectRecord
+)
+from asa_config._argument_load import load as load_argument_groups
+
+from .synthetic import generate_config
+
+
+def _validate_value(value):
+    if isinstance(value, ObjectRecord):
+        return _validate_object(value)
+
+    if isinstance(value, tuple):
+        return tuple(_validate_value(item) for item in value)
+
+    return value
+
+
+def _validate_object(record: ObjectRecord) -> Object:
+    return Object(
+        name=record.name,
+        properties=OrderedDict(
+            (name, _validate_value(value))
+            for name, value in record.properties.items()
+        )
+    )
+
+
+def _validate_group(record: ObjectGroupRecord) -> ObjectGroup:
+    return ObjectGroup(
+        root=_validate_object(record.root),
+        children=[_validate_group(child) for child in record.children]
+    )
+
+
+def _validate_arguments(group) -> ArgumentGroup:
+    return ArgumentGroup(
+        root=group.root,
+        children=[_validate_arguments(child) for child in group.children]
+    )
+
+
+def _timed(function, repeat: int = 3) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+
+    return min(timings)
+
+
+def main(access_list_lines: int = 10_000):
+    rules = asa_config.RuleSet(asa_config.json_rule.load_all())
+    text = generate_config(
+        objects=access_list_lines // 10,
+        groups=access_list_lines // 50,
+        members=10,
+        access_list_lines=access_list_lines
+    )
+    lines = text.count("\n")
+
+    def validated():
+        for group in load_argument_groups(text, models=False):
+            _validate_arguments(group)
+
+        for group in asa_config.load(text, rules, models=False):
+            _validate_group(group)
+
+    timings = {
+        "records": _timed(
+            lambda: asa_config.load(text, rules, models=False)
+        ),
+        "models": _timed(lambda: asa_config.load(text, rules)),
+        "validated": _timed(validated)
+    }
+
+    print(f"{lines} lines")
+
+    for name, seconds in timings.items():
+        print(f"{name:>10}: {seconds / lines * 1e6:8.2f} us/line")
+
+
+if __name__ == "__main__":
+    main()
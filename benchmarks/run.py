@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+
+from importlib import metadata
+from time import perf_counter
+from typing import Any, Callable
+
+import asa_config
+import asa_config.json_rule
+
+from asa_config._argument_load import _group_entries, _read_entries
+from asa_config._rule import match_object_group
+
+from .synthetic import generate_config
+
+
+def _timed(function: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = None
+    result = None
+
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function()
+        elapsed = perf_counter() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best, result
+
+
+def _version() -> str | None:
+    try:
+        return metadata.version("asa-config")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def run(
+    objects: int = 5000,
+    groups: int = 1000,
+    members: int = 20,
+    access_list_lines: int = 100_000,
+    repeat: int = 3,
+    seed: int = 0
+) -> dict[str, Any]:
+    text = generate_config(
+        objects=objects,
+        groups=groups,
+        members=members,
+        access_list_lines=access_list_lines,
+        seed=seed
+    )
+    lines = text.count("\n")
+
+    stages = {}
+
+    def stage(name: str, function: Callable[[], Any], count: int) -> Any:
+        seconds, result = _timed(function, repeat)
+        stages[name] = {
+            "seconds": seconds,
+            "items": count,
+            "items_per_second": count / seconds if seconds else None
+        }
+
+        return result
+
+    rules = stage("load_all", asa_config.json_rule.load_all, 1)
+    rule_set = stage("compile_rules", lambda: asa_config.RuleSet(rules), 1)
+    entries = stage("read_entries", lambda: _read_entries(text), lines)
+    argument_groups = stage(
+        "group_entries",
+        lambda: _group_entries(entries),
+        lines
+    )
+    object_groups = stage(
+        "match_object_group",
+        lambda: [
+            match_object_group(group, rule_set, models=False)
+            for group in argument_groups
+        ],
+        lines
+    )
+    stage(
+        "to_model",
+        lambda: [group.to_model() for group in object_groups],
+        lines
+    )
+    stage("load", lambda: asa_config.load(text, rule_set), lines)
+
+    return {
+        "version": _version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "parameters": {
+            "objects": objects,
+            "groups": groups,
+            "members": members,
+            "access_list_lines": access_list_lines,
+            "repeat": repeat,
+            "seed": seed
+        },
+        "lines": lines,
+        "bytes": len(text.encode("utf-8")),
+        "stages": stages
+    }
+
+
+def compare(
+    result: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float
+) -> list[str]:
+    regressions = []
+
+    for name, stage in result["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+
+        if previous is None or not previous["items_per_second"] or \
+                not stage["items_per_second"]:
+            continue
+
+        ratio = stage["items_per_second"] / previous["items_per_second"]
+
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{name}: {stage['items_per_second']:.0f}/s vs "
+                f"{previous['items_per_second']:.0f}/s ({ratio:.0%})"
+            )
+
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time each asa_config parsing stage on a synthetic config"
+    )
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--access-list-lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON result to a file")
+    parser.add_argument("--baseline", help="JSON result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    options = parser.parse_args(arguments)
+
+    result = run(
+        objects=options.objects,
+        groups=options.groups,
+        members=options.members,
+        access_list_lines=options.access_list_lines,
+        repeat=options.repeat,
+        seed=options.seed
+    )
+    output = json.dumps(result, indent=2)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as stream:
+            stream.write(output + "\n")
+    else:
+        print(output)
+
+    if options.baseline:
+        with open(options.baseline, "r", encoding="utf-8") as stream:
+            baseline = json.load(stream)
+
+        regressions = compare(result, baseline, options.tolerance)
+
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
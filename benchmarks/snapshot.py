@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+from time import perf_counter
+
+import asa_config
+import asa_config.json_rule
+
+from .synthetic import generate_config
+
+
+def main(access_list_lines: int = 100_000):
+    rules = asa_config.RuleSet(asa_config.json_rule.load_all())
+    text = generate_config(access_list_lines=access_list_lines)
+    lines = text.count("\n")
+
+    start = perf_counter()
+    groups = asa_config.load(text, rules, models=False)
+    parsed = perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.snapshot")
+
+        start = perf_counter()
+        asa_config.dump_snapshot(groups, path)
+        dumped = perf_counter() - start
+
+        start = perf_counter()
+
+        with asa_config.load_snapshot(path) as snapshot:
+            entry = snapshot[len(snapshot) // 2]
+            entry.root.properties["name"]
+
+            opened = perf_counter() - start
+
+            start = perf_counter()
+            snapshot.to_models()
+            materialized = perf_counter() - start
+
+        size = os.path.getsize(path)
+
+    print(f"{lines} lines, {size / 1024 / 1024:.1f} MiB snapshot")
+    print(f"        parse: {parsed * 1e3:10.1f} ms")
+    print(f"         dump: {dumped * 1e3:10.1f} ms")
+    print(f" open + entry: {opened * 1e3:10.1f} ms")
+    print(f"   all models: {materialized * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import random
+
+from io import StringIO
+
+
+__all__ = (
+    "generate_config",
+)
+
+
+_PROTOCOLS = ("tcp", "udp", "sctp")
+
+_ACCESS = ("permit", "deny")
+
+
+def _address(index: int) -> str:
+    return f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+
+
+def _port(generator: random.Random, service_groups: int) -> str | None:
+    choice = generator.random()
+
+    if choice < 0.35:
+        return None
+
+    if choice < 0.6:
+        return f"eq {generator.choice((22, 53, 80, 123, 443, 8080))}"
+
+    if choice < 0.75:
+        start = generator.randrange(1024, 60000)
+
+        return f"range {start} {start + generator.randrange(1, 100)}"
+
+    if choice < 0.8:
+        operator = generator.choice(("lt", "gt", "neq"))
+
+        return f"{operator} {generator.randrange(1, 65536)}"
+
+    return f"object-group GRP_SVC{generator.randrange(service_groups)}"
+
+
+def _user(generator: random.Random) -> str | None:
+    choice = generator.random()
+
+    if choice < 0.85:
+        return None
+
+    return generator.choice((
+        "user any",
+        "user none",
+        "user LOCAL\\jdoe",
+        "object-group-user GRP_USR0",
+        "user-group LOCAL\\\\admins"
+    ))
+
+
+def _log(generator: random.Random) -> str | None:
+    choice = generator.random()
+
+    if choice < 0.3:
+        return None
+
+    return generator.choice((
+        "log",
+        "log",
+        "log 5",
+        "log 6 interval 300",
+        "log interval 60",
+        "log disable",
+        "log default"
+    ))
+
+
+def _access_list_line(
+    generator: random.Random,
+    name: str,
+    index: int,
+    groups: int,
+    service_groups: int
+) -> str:
+    if generator.random() < 0.05:
+        return f"access-list {name} remark CH:{index};DA:20230807;RE:synthetic"
+
+    parts = ["access-list", name]
+
+    if generator.random() < 0.1:
+        parts += ["line", str(index + 1)]
+
+    parts += [
+        "extended",
+        generator.choice(_ACCESS),
+        generator.choice(_PROTOCOLS)
+    ]
+
+    optional = (
+        _user(generator),
+        f"object-group GRP_NET{generator.randrange(groups)}",
+        _port(generator, service_groups),
+        f"object-group GRP_NET{generator.randrange(groups)}",
+        _port(generator, service_groups),
+        _log(generator),
+        "time-range WORKDAYS" if generator.random() < 0.05 else None,
+        "inactive" if generator.random() < 0.02 else None
+    )
+
+    parts += [part for part in optional if part is not None]
+
+    return " ".join(parts)
+
+
+def generate_config(
+    objects: int = 5000,
+    groups: int = 1000,
+    members: int = 20,
+    access_list_lines: int = 100_000,
+    access_lists: int = 50,
+    seed: int = 0
+) -> str:
+    generator = random.Random(seed)
+    service_groups = max(1, groups // 10)
+    output = StringIO()
+    write = output.write
+
+    for index in range(objects):
+        address = _address(index)
+
+        write(f"object network HST_{address}\n")
+        write(f" host {address}\n")
+        write(f" description synthetic host {index}\n")
+
+    for index in range(groups):
+        write(f"object-group network GRP_NET{index}\n")
+
+        for _ in range(members):
+            member = _address(generator.randrange(max(1, objects)))
+
+            write(f" network-object object HST_{member}\n")
+
+    for index in range(access_list_lines):
+        name = f"ACL_{index % access_lists}"
+        line = _access_list_line(
+            generator,
+            name,
+            index // access_lists,
+            max(1, groups),
+            service_groups
+        )
+
+        write(line)
+        write("\n")
+
+    return output.getvalue()
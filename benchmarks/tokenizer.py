@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+
+from time import perf_counter
+
+from asa_config._argument_load import (
+    _iter_file_entries,
+    _read_entries,
+    load,
+    load_file
+)
+
+from .synthetic import generate_config
+
+
+def _timed(function) -> float:
+    start = perf_counter()
+    function()
+
+    return perf_counter() - start
+
+
+def main(megabytes: int = 20):
+    block = generate_config(
+        objects=1000,
+        groups=200,
+        members=10,
+        access_list_lines=10_000
+    )
+    repeat = max(1, megabytes * 1024 * 1024 // len(block))
+
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        suffix=".cfg",
+        delete=False
+    ) as file:
+        for _ in range(repeat):
+            file.write(block)
+
+    try:
+        size = os.path.getsize(file.name) / (1024 * 1024)
+
+        def read_stream():
+            with open(file.name, "r", encoding="utf-8") as stream:
+                return _read_entries(stream)
+
+        def load_stream():
+            with open(file.name, "r", encoding="utf-8") as stream:
+                return load(stream, models=False)
+
+        timings = {
+            "readline entries": _timed(read_stream),
+            "mmap entries": _timed(
+                lambda: list(_iter_file_entries(file.name))
+            ),
+            "readline groups": _timed(load_stream),
+            "mmap groups": _timed(
+                lambda: load_file(file.name, models=False)
+            )
+        }
+    finally:
+        os.unlink(file.name)
+
+    print(f"{size:.1f} MiB")
+
+    for name, seconds in timings.items():
+        print(f"{name:>16}: {size / seconds:8.2f} MiB/s")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
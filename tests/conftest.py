@@ -0,0 +1,36 @@
+from textwrap import dedent
+
+import pytest
+
+import asa_config.json_rule
+
+
+SAMPLE_CONFIG = dedent(
+    """
+    object network HST_158.87.185.149
+     host 158.87.185.149
+     description VLAN1026_GSNI-FFM-SDE-IR-10
+    object network HST_158.87.185.148
+     host 158.87.185.148
+     description defrvep01ir10wm
+    object-group network GRP_NET1691403080
+     network-object object HST_158.87.185.148
+     network-object object HST_158.87.185.149
+
+    access-list MY_ACL remark CH:aaa;DA:20230807;IM:aaa;RE:aaa;
+    access-list MY_ACL line 2 remark DE:aaa
+    access-list MY_ACL extended permit TCP object-group GRP_NET1691403080 object-group GRP_NET1691403081 object-group GRP_SVCTCP1652862712 log
+    access-list MY_ACL extended deny UDP user any object-group GRP_NET1691403080 range 1000 2000 object-group GRP_IBMSOBOX eq 888 log 5 interval 30
+    access-list MY_ACL line 7 extended permit sctp object-group GRP_IBMSOBOX object-group GRP_NET1691403080 log disable time-range WORKDAYS inactive
+    """
+)
+
+
+@pytest.fixture(scope="session")
+def rules():
+    return asa_config.json_rule.load_all()
+
+
+@pytest.fixture
+def sample_config():
+    return SAMPLE_CONFIG
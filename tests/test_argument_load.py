@@ -2,8 +2,16 @@ from textwrap import dedent
 
 import pytest
 
-from asa_config._argument import ArgumentGroup
-from asa_config._argument_load import load
+import asa_config._argument_load
+
+from asa_config._argument import ArgumentGroup, ArgumentGroupRecord
+from asa_config._argument_load import (
+    IndentationError,
+    _ArgumentEntry,
+    _group_entries,
+    load,
+    load_file
+)
 
 
 @pytest.mark.parametrize(
@@ -65,3 +73,123 @@ def test_load(input, expected):
     result = load(input)
 
     assert result == expected
+
+
+def test_load_records():
+    text = dedent(
+        """
+        object network HST_158.87.185.149
+            host 158.87.185.149
+        """
+    )
+
+    records = load(text, models=False)
+
+    assert records == [
+        ArgumentGroupRecord(
+            root=["object", "network", "HST_158.87.185.149"],
+            children=[
+                ArgumentGroupRecord(
+                    root=["host", "158.87.185.149"],
+                    children=[]
+                )
+            ]
+        )
+    ]
+    assert [record.to_model() for record in records] == load(text)
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        "\n  \n\t \n\n",
+        "a b\n\tc\n\t\td  \r\n",
+        "a\n  b\n    c\n  d\ne",
+        "object network A\n description x  y  \n  \n",
+        "a\n\tb\n\t\tc\nd\n  e\n"
+    ]
+)
+def test_load_file(tmp_path, monkeypatch, input):
+    monkeypatch.setattr(asa_config._argument_load, "_CHUNK_SIZE", 4)
+
+    path = tmp_path / "config.txt"
+    path.write_bytes(input.encode("utf-8"))
+
+    assert load_file(path) == load(input)
+
+
+@pytest.mark.parametrize("input", ["a\n \tb\n", "a\n  b\n   c\n"])
+def test_load_file_indentation_error(tmp_path, input):
+    path = tmp_path / "config.txt"
+    path.write_bytes(input.encode("utf-8"))
+
+    with pytest.raises(IndentationError):
+        load(input)
+
+    with pytest.raises(IndentationError):
+        load_file(path)
+
+
+@pytest.mark.parametrize("from_file", [False, True], ids=["stream", "file"])
+def test_load_interns_tokens(tmp_path, monkeypatch, from_file):
+    text = "".join(
+        f"access-list ACL_{index % 3} extended permit {index}\n"
+        for index in range(20)
+    )
+    path = tmp_path / "config.txt"
+    path.write_bytes(text.encode("utf-8"))
+
+    def tokens():
+        records = load_file(path, models=False) if from_file \
+            else load(text, models=False)
+
+        return [token for record in records for token in record.root]
+
+    first = {}
+
+    for token in tokens():
+        assert first.setdefault(token, token) is token
+
+    monkeypatch.setattr(asa_config._argument_load, "_MAX_INTERNED_TOKENS", 5)
+
+    loaded = tokens()
+
+    assert loaded[6] == loaded[21] == "ACL_1"
+    assert loaded[0] is loaded[5]
+    assert loaded[6] is not loaded[21]
+
+
+def _entries(*levels):
+    return [
+        _ArgumentEntry([str(index)], level)
+        for index, level in enumerate(levels)
+    ]
+
+
+def test_group_entries_nested():
+    groups = _group_entries(_entries(0, 1, 2, 3, 2, 1, 0, 1))
+
+    assert groups == [
+        ArgumentGroupRecord(["0"], [
+            ArgumentGroupRecord(["1"], [
+                ArgumentGroupRecord(["2"], [
+                    ArgumentGroupRecord(["3"], [])
+                ]),
+                ArgumentGroupRecord(["4"], [])
+            ]),
+            ArgumentGroupRecord(["5"], [])
+        ]),
+        ArgumentGroupRecord(["6"], [
+            ArgumentGroupRecord(["7"], [])
+        ])
+    ]
+
+
+@pytest.mark.parametrize(
+    "levels",
+    [(1,), (0, 2), (0, 1, 3), (0, 1, 0, 2)]
+)
+def test_group_entries_indentation_mismatch(levels):
+    with pytest.raises(ValueError, match="Indentation mismatch"):
+        _group_entries(_entries(*levels))
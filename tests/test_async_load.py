@@ -0,0 +1,115 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import asa_config
+from asa_config._argument_load import IndentationError
+
+
+async def _collect(source, rules, **kwargs):
+    return [group async for group in asa_config.aload(source, rules, **kwargs)]
+
+
+async def _lines(text):
+    for line in text.splitlines(keepends=True):
+        await asyncio.sleep(0)
+
+        yield line
+
+
+def test_aload_lines(rules, sample_config):
+    result = asyncio.run(_collect(_lines(sample_config), rules))
+
+    assert result == asa_config.load(sample_config, rules)
+
+
+def test_aload_offloads_large_blocks(rules, sample_config):
+    with ThreadPoolExecutor(1) as executor:
+        result = asyncio.run(
+            _collect(
+                _lines(sample_config),
+                rules,
+                models=False,
+                executor=executor,
+                offload_lines=2
+            )
+        )
+
+    assert result == asa_config.load(sample_config, rules, models=False)
+
+
+def test_aload_stream_reader_is_incremental(rules, sample_config):
+    data = sample_config.encode("utf-8")
+    split = data.index(b"\n", data.index(b"HST_158.87.185.148")) + 1
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data[:split])
+
+        groups = asa_config.aload(reader, rules)
+        first = await anext(groups)
+
+        reader.feed_data(data[split:])
+        reader.feed_eof()
+
+        return first, [group async for group in groups]
+
+    first, rest = asyncio.run(main())
+
+    assert [first, *rest] == asa_config.load(sample_config, rules)
+
+
+def test_aload_yields_to_event_loop(rules):
+    text = "".join(
+        f"access-list ACL extended permit tcp object-group A{index} "
+        f"object-group B{index}\n"
+        for index in range(256)
+    )
+
+    async def main():
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+
+            while not done:
+                ticks += 1
+
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        reader = asyncio.StreamReader()
+        reader.feed_data(text.encode("utf-8"))
+        reader.feed_eof()
+
+        await asyncio.sleep(0)
+
+        start = ticks
+        groups = [
+            group async for group in asa_config.aload(
+                reader,
+                rules,
+                offload_lines=16
+            )
+        ]
+        done = True
+
+        await task
+
+        return groups, ticks - start
+
+    groups, ticks = asyncio.run(main())
+
+    assert len(groups) == 256
+    assert ticks >= 256 // 16 - 1
+
+
+def test_aload_errors(rules):
+    with pytest.raises(IndentationError):
+        asyncio.run(_collect(_lines("a\n   b\n\tc\n"), rules))
+
+    with pytest.raises(asa_config.MatchError):
+        asyncio.run(_collect(_lines("no-such-rule\n"), rules))
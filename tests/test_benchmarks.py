@@ -0,0 +1,64 @@
+import asa_config
+
+from benchmarks.run import compare, run
+from benchmarks.synthetic import generate_config
+
+
+def test_generate_config_parses(rules):
+    text = generate_config(
+        objects=20,
+        groups=5,
+        members=3,
+        access_list_lines=500
+    )
+
+    groups = asa_config.load(text, rules, models=False)
+
+    assert len(groups) == 525
+    assert text == generate_config(
+        objects=20,
+        groups=5,
+        members=3,
+        access_list_lines=500
+    )
+
+
+def test_run_reports_stages():
+    result = run(
+        objects=5,
+        groups=2,
+        members=2,
+        access_list_lines=20,
+        repeat=1
+    )
+
+    assert set(result["stages"]) == {
+        "load_all",
+        "compile_rules",
+        "read_entries",
+        "group_entries",
+        "match_object_group",
+        "to_model",
+        "load"
+    }
+    assert compare(result, result, 0.1) == []
+
+    slower = {
+        "stages": {
+            name: {**stage, "items_per_second": stage["items_per_second"] * 2}
+            for name, stage in result["stages"].items()
+        }
+    }
+
+    assert len(compare(result, slower, 0.1)) == len(result["stages"])
+
+
+def test_compare_skips_stages_without_rate():
+    measured = {"seconds": 1.0, "items": 10, "items_per_second": 10.0}
+    empty = {"seconds": 0.0, "items": 10, "items_per_second": None}
+
+    assert compare(
+        {"stages": {"a": empty, "b": measured}},
+        {"stages": {"a": measured, "b": empty}},
+        0.1
+    ) == []
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+import asa_config
+from asa_config._codegen import compile_matcher, generate_source
+from asa_config._rule import (
+    IntegerRule,
+    LiteralRule,
+    ObjectRule,
+    ObjectRuleProperty,
+    OptionalRule,
+    StringRule,
+    TextRule,
+    TupleRule,
+    UnionRule
+)
+
+from benchmarks.synthetic import generate_config
+
+
+_WORDS = (
+    "access-list X line 3 extended permit deny tcp UDP sctp user any none "
+    "object-group-user user-group object-group A B lt gt eq neq range 80 "
+    "443 security-group name tag object-group-security log 5 interval 10 "
+    "disable default time-range T inactive remark foo object network host "
+    "network-object description"
+).split(" ")
+
+
+def _fuzzed_lines(count, seed=0):
+    generator = random.Random(seed)
+
+    for _ in range(count):
+        head = generator.choice((
+            ["access-list", "X"],
+            ["object", "network"],
+            ["object-group", "network"],
+            ["network-object"],
+            ["host"],
+            ["description"]
+        ))
+
+        yield head + [
+            generator.choice(_WORDS)
+            for _ in range(generator.randint(0, 14))
+        ]
+
+
+def _all_rules(rules):
+    for rule in rules:
+        yield rule
+        yield from _all_rules(rule.children)
+
+
+def _result(result):
+    if result is None:
+        return None
+
+    value, end = result
+
+    return repr(value), end
+
+
+def test_compiled_matches_interpreter(rules, sample_config):
+    text = sample_config + generate_config(
+        objects=20,
+        groups=5,
+        members=3,
+        access_list_lines=500,
+        seed=1
+    )
+    lines = [line.strip().split(" ") for line in text.splitlines()]
+    lines += _fuzzed_lines(3000)
+
+    for rule in _all_rules(rules):
+        matcher = compile_matcher(rule)
+
+        for line in lines:
+            for start in (0, 1):
+                assert _result(matcher(line, start)) == \
+                    _result(rule.match_first(line, start)), (rule.name, line)
+
+
+def test_compiled_load_matches_interpreter(rules, sample_config):
+    text = sample_config + generate_config(
+        objects=20,
+        groups=5,
+        members=3,
+        access_list_lines=500
+    )
+
+    assert asa_config.load(text, asa_config.RuleSet(rules)) == \
+        asa_config.load(text, asa_config.RuleSet(rules, compiled=False))
+
+
+@pytest.mark.parametrize(
+    "rule, tokens, expected",
+    [
+        (TupleRule(values=[]), ["a"], None),
+        (
+            TupleRule(values=[
+                UnionRule(values=[
+                    LiteralRule(value="A"),
+                    IntegerRule(),
+                    LiteralRule(value="b")
+                ]),
+                OptionalRule(TextRule())
+            ]),
+            ["x", "5"],
+            ((5, None), 2)
+        ),
+        (
+            TupleRule(values=[StringRule(), IntegerRule()]),
+            ["x", "y", "z"],
+            None
+        )
+    ]
+)
+def test_compiled_tuple_rules(rule, tokens, expected):
+    wrapper = ObjectRule(
+        name="x",
+        properties=[ObjectRuleProperty(name="value", value=rule)],
+        children=[]
+    )
+    result = compile_matcher(wrapper)(tokens, 0)
+
+    if expected is None:
+        assert result is None
+    else:
+        value, end = result
+
+        assert (value.properties["value"], end) == expected
+
+
+def test_compiled_source_is_cached(rules):
+    rule = next(rule for rule in rules if rule.name == "access-list")
+
+    assert generate_source(rule) == generate_source(rule.model_copy())
+    assert compile_matcher(rule) is compile_matcher(rule.model_copy())
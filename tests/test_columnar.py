@@ -0,0 +1,65 @@
+import pytest
+
+import asa_config
+
+
+@pytest.fixture(params=[True, False], ids=["models", "records"])
+def table(request, rules, sample_config):
+    groups = asa_config.load(sample_config, rules, models=request.param)
+
+    return asa_config.export_columns(groups, "access-list")
+
+
+def test_export_columns(table):
+    assert len(table) == 5
+    assert list(table)[:4] == ["name", "line", "line.number", "remark"]
+
+    name = table["name"]
+
+    assert isinstance(name, asa_config.StringColumn)
+    assert name.dictionary == ["MY_ACL"]
+    assert list(name.codes) == [0] * 5
+    assert table["access"].to_pylist() == \
+        [None, None, "permit", "deny", "permit"]
+    assert table["source_address.name"][4] == "GRP_IBMSOBOX"
+    assert table["access"].code("deny") == 1
+    assert table["access"].code("missing") == -1
+
+
+def test_export_integer_columns(table):
+    line = table["line.number"]
+
+    assert isinstance(line, asa_config.IntegerColumn)
+    assert line.values.typecode == "q"
+    assert line.to_pylist() == [None, 2, None, None, 7]
+    assert table["log.options.1.seconds"][3] == 30
+
+
+def test_export_nested_rule(rules, sample_config):
+    table = asa_config.export_columns(
+        asa_config.load(sample_config, rules),
+        "network-object"
+    )
+
+    assert table.to_pydict() == {
+        "value": ["object", "object"],
+        "value.name": ["HST_158.87.185.148", "HST_158.87.185.149"]
+    }
+
+
+def test_export_empty():
+    table = asa_config.export_columns([], "access-list")
+
+    assert len(table) == 0
+    assert table.to_pydict() == {}
+
+
+def test_export_arrow(table):
+    pyarrow = pytest.importorskip("pyarrow")
+
+    arrow = table.to_arrow()
+
+    assert isinstance(arrow, pyarrow.Table)
+    assert arrow.num_rows == 5
+    assert arrow.column("access").to_pylist() == \
+        table["access"].to_pylist()
@@ -0,0 +1,96 @@
+from asa_config._decision import match_sequence
+from asa_config._rule import (
+    LiteralRule,
+    ObjectRule,
+    ObjectRuleProperty,
+    OptionalRule,
+    StringRule,
+    TupleRule
+)
+
+
+class _Take:
+    def __init__(self, calls=None):
+        self.calls = calls
+
+    def match_at(self, tokens, start, memo=None):
+        if self.calls is not None:
+            self.calls.append((id(self), start))
+
+        for end in range(start, len(tokens) + 1):
+            yield tokens[start:end], end
+
+
+class _Fail:
+    def match_at(self, tokens, start, memo=None):
+        return iter(())
+
+
+def test_match_sequence_order():
+    decisions = list(match_sequence([_Take(), _Take()], ["a", "b"]))
+
+    assert decisions == [
+        (([], []), 0),
+        (([], ["a"]), 1),
+        (([], ["a", "b"]), 2),
+        ((["a"], []), 1),
+        ((["a"], ["b"]), 2),
+        ((["a", "b"], []), 2)
+    ]
+
+
+def test_match_sequence_without_matchers():
+    assert list(match_sequence([], ["a"])) == []
+
+
+def test_match_sequence_memoizes_offsets():
+    calls = []
+    matchers = [_Take(calls) for _ in range(12)] + [_Fail()]
+
+    assert list(match_sequence(matchers, ["a"] * 12)) == []
+    assert len(calls) == len(set(calls))
+
+
+def test_object_rule_backtracking_is_polynomial():
+    rule = ObjectRule(
+        name="x",
+        properties=[
+            ObjectRuleProperty(
+                name=str(index),
+                value=OptionalRule(StringRule())
+            )
+            for index in range(40)
+        ] + [
+            ObjectRuleProperty(name="end", value=LiteralRule(value="end"))
+        ],
+        children=[]
+    )
+
+    assert list(rule.match_at(["x"] + ["a"] * 40, 0)) == []
+
+    result, rest = next(rule.match(["x"] + ["a"] * 20 + ["end"]))
+
+    assert result.properties["end"] == "end"
+    assert rest == []
+
+
+def test_tuple_rule():
+    rule = TupleRule(values=[StringRule(), OptionalRule(StringRule())])
+
+    assert list(rule.match(["a", "b"])) == [
+        (("a", "b"), []),
+        (("a", None), ["b"])
+    ]
+
+
+def test_match_sequence_shares_memo():
+    calls = []
+    shared = _Take(calls)
+    memo = {}
+
+    first = list(match_sequence([shared, _Take()], ["a", "b"], 0, memo))
+    second = list(match_sequence([shared, _Fail()], ["a", "b"], 0, memo))
+
+    assert len(first) == 6
+    assert second == []
+    assert calls == [(id(shared), 0)]
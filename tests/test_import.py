@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+from importlib import import_module
+
+import pytest
+
+import asa_config
+
+
+_IMPORT_BUDGET_US = 100_000
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True
+    )
+    times = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_is_lazy():
+    times = _import_times("import asa_config")
+
+    assert times["asa_config"] < _IMPORT_BUDGET_US
+    assert "pydantic" not in times
+    assert not any(name.startswith("asa_config.") for name in times)
+
+
+def test_json_rule_defers_jsonref():
+    times = _import_times("import asa_config.json_rule")
+
+    assert "asa_config.json_rule" in times
+    assert "jsonref" not in times
+
+
+def test_load_defers_parallel():
+    times = _import_times("from asa_config import load")
+
+    assert "asa_config._rule" in times
+    assert "asa_config._parallel" not in times
+
+
+def test_exports_match_modules():
+    for module, names in asa_config._EXPORTS.items():
+        assert import_module(f"asa_config.{module}").__all__ == names
+
+        for name in names:
+            assert name in dir(asa_config)
+            assert getattr(asa_config, name) is getattr(
+                import_module(f"asa_config.{module}"),
+                name
+            )
+
+    with pytest.raises(AttributeError):
+        asa_config.missing
@@ -0,0 +1,48 @@
+import pytest
+
+import asa_config
+
+
+@pytest.fixture(params=[True, False], ids=["models", "records"])
+def index(request, rules, sample_config):
+    return asa_config.ConfigIndex(
+        asa_config.load(sample_config, rules, models=request.param)
+    )
+
+
+def test_index_definitions(index):
+    group = index.get("object", "HST_158.87.185.149")
+
+    assert group.root.properties["name"] == "HST_158.87.185.149"
+    assert group.children[0].root.properties["value"] == "158.87.185.149"
+    assert index.get("object-group", "GRP_NET1691403080") is index.groups[2]
+    assert index.get("object", "MISSING") is None
+    assert len(index) == 8
+
+
+def test_index_access_lists(index):
+    entries = index.access_list("MY_ACL")
+
+    assert entries == index.groups[3:]
+    assert index.access_list_names() == ["MY_ACL"]
+    assert index.access_list("MISSING") == []
+
+
+def test_index_members(index):
+    members = index.members("GRP_NET1691403080")
+
+    assert [member.root.properties["name"] for member in members] == \
+        ["HST_158.87.185.148", "HST_158.87.185.149"]
+
+    with pytest.raises(KeyError):
+        index.members("MISSING")
+
+
+def test_index_references(index):
+    assert index.references("object", "HST_158.87.185.148") == \
+        [index.groups[2]]
+    assert index.references("object-group", "GRP_NET1691403080") == \
+        [index.groups[5], index.groups[6], index.groups[7]]
+    assert index.references("object-group", "GRP_IBMSOBOX") == \
+        [index.groups[6], index.groups[7]]
+    assert index.references("object", "MISSING") == []
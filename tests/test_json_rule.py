@@ -0,0 +1,118 @@
+import shutil
+
+from pathlib import Path
+
+import asa_config.json_rule
+
+
+_RULE_DIRECTORY = Path(asa_config.json_rule.__file__).parent.parent \
+    / "object_rules"
+
+
+def test_load_all_cache(tmp_path, monkeypatch, rules):
+    cache_directory = tmp_path / "cache"
+
+    cold = asa_config.json_rule.load_all(cache_directory=cache_directory)
+
+    assert cold == rules
+    assert len(list(cache_directory.glob("rules-*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rule files should not be parsed")
+
+    monkeypatch.setattr(asa_config.json_rule, "load_file", fail)
+
+    warm = asa_config.json_rule.load_all(cache_directory=cache_directory)
+
+    assert warm == rules
+
+
+def test_load_all_cache_invalidation(tmp_path):
+    directory = tmp_path / "rules"
+    cache_directory = tmp_path / "cache"
+    shutil.copytree(_RULE_DIRECTORY, directory)
+
+    before = asa_config.json_rule.load_all(directory, cache_directory)
+
+    access = directory / "access_list" / "_access.json"
+    access.write_text(access.read_text().replace("deny", "reject"))
+
+    after = asa_config.json_rule.load_all(directory, cache_directory)
+
+    assert after != before
+    assert after == asa_config.json_rule.load_all(directory)
+    assert len(list(cache_directory.glob("rules-*.pickle"))) == 2
+
+
+def test_load_all_corrupt_cache(tmp_path, rules):
+    asa_config.json_rule.load_all(cache_directory=tmp_path)
+
+    for content in (b"garbage", b"\x80\x09garbage", b""):
+        for path in tmp_path.glob("rules-*.pickle"):
+            path.write_bytes(content)
+
+        assert asa_config.json_rule.load_all(cache_directory=tmp_path) == \
+            rules
+
+
+def _access_list_properties(rules):
+    rule = next(
+        rule for rule in rules
+        if rule.name == "access-list" and len(rule.properties) > 3
+    )
+
+    return {prop.name: prop.value for prop in rule.properties}
+
+
+def test_load_all_interns_shared_rules(tmp_path, rules):
+    properties = _access_list_properties(rules)
+
+    assert properties["source_address"] is properties["destination_address"]
+    assert properties["source_port"] is properties["destination_port"]
+    assert properties["source_security_group"] is \
+        properties["destination_security_group"]
+
+    asa_config.json_rule.load_all(cache_directory=tmp_path)
+    cached = asa_config.json_rule.load_all(cache_directory=tmp_path)
+    properties = _access_list_properties(cached)
+
+    assert properties["source_port"] is properties["destination_port"]
+
+
+def _bound_rules(rules):
+    stack = list(rules)
+
+    while stack:
+        rule = stack.pop()
+        stack.extend(rule.children)
+
+        yield rule
+
+
+def test_load_all_binds_interned_matchers(tmp_path, rules):
+    asa_config.json_rule.load_all(cache_directory=tmp_path)
+    cached = asa_config.json_rule.load_all(cache_directory=tmp_path)
+
+    for loaded in (rules, cached):
+        for rule in _bound_rules(loaded):
+            assert len(rule._matchers) == len(rule.properties)
+            assert all(
+                matcher is prop.value
+                for matcher, prop in zip(rule._matchers, rule.properties)
+            )
+
+
+def test_memo_is_shared_between_source_and_destination(rules):
+    address = _access_list_properties(rules)["source_address"]
+    rule = next(
+        rule for rule in rules
+        if rule.name == "access-list" and len(rule.properties) > 3
+    )
+    tokens = "access-list A extended permit tcp object-group B " \
+        "object-group C".split()
+    memo = {}
+
+    assert list(rule.match_at(tokens, 0, memo))
+    assert {5, 7} <= {
+        start for matcher, start in memo if matcher == id(address)
+    }
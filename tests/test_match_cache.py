@@ -0,0 +1,101 @@
+import pytest
+
+import asa_config
+
+
+def test_match_cache_lru():
+    cache = asa_config.MatchCache(maxsize=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.as_dict() == {"hits": 2, "misses": 1, "size": 2, "maxsize": 2}
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_match_cache_maxsize():
+    with pytest.raises(ValueError):
+        asa_config.MatchCache(maxsize=0)
+
+
+def test_load_with_match_cache(rules, sample_config):
+    rule_set = asa_config.RuleSet(rules)
+    cache = asa_config.MatchCache()
+    config = sample_config + sample_config
+
+    result = asa_config.load(config, rule_set, cache=cache)
+
+    assert result == asa_config.load(config, rule_set)
+    assert cache.hits > 0
+    assert cache.misses == len(cache)
+
+    half = len(result) // 2
+
+    for first, second in zip(result[:half], result[half:]):
+        assert first.root == second.root
+        assert first.root is not second.root
+
+
+@pytest.mark.parametrize("models", [True, False], ids=["models", "records"])
+def test_match_cache_results_are_independent(rules, sample_config, models):
+    rule_set = asa_config.RuleSet(rules)
+    cache = asa_config.MatchCache()
+    config = sample_config + sample_config
+
+    first = asa_config.load(config, rule_set, models=models, cache=cache)
+    second = asa_config.load(config, rule_set, models=models, cache=cache)
+    half = len(first) // 2
+
+    first[-1].root.properties["log"].properties["options"] = None
+    first[-1].root.properties["name"] = "CHANGED"
+
+    for group in (first[half - 1], second[-1]):
+        assert group.root.properties["name"] == "MY_ACL"
+        assert group.root.properties["log"].properties["options"] == \
+            "disable"
+
+    assert second == asa_config.load(config, rule_set, models=models)
+
+
+def test_match_object_cache(rules):
+    rule_set = asa_config.RuleSet(rules)
+    cache = asa_config.MatchCache()
+    arguments = ["access-list", "ACL", "remark", "text"]
+
+    first, rule = asa_config.match_object(arguments, rule_set, cache=cache)
+    second, cached_rule = asa_config.match_object(
+        arguments,
+        rule_set,
+        cache=cache
+    )
+
+    assert first == second
+    assert first is not second
+    assert rule is cached_rule
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(asa_config.MatchError):
+        asa_config.match_object(["no-such-rule"], rule_set, cache=cache)
+
+    assert len(cache) == 1
+
+
+def test_match_cache_workers(rules, sample_config):
+    with pytest.raises(ValueError):
+        asa_config.load(
+            sample_config,
+            rules,
+            workers=2,
+            cache=asa_config.MatchCache()
+        )
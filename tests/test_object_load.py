@@ -0,0 +1,137 @@
+import pickle
+from io import StringIO, TextIOBase
+
+import pytest
+
+import asa_config
+import asa_config._parallel
+
+
+class _LineStream(TextIOBase):
+    def __init__(self, text):
+        self.lines = text.splitlines(keepends=True)
+        self.consumed = 0
+
+    def readable(self):
+        return True
+
+    def readline(self, size=-1):
+        if self.consumed == len(self.lines):
+            return ""
+
+        self.consumed += 1
+
+        return self.lines[self.consumed - 1]
+
+
+def test_iter_load_matches_load(rules, sample_config):
+    assert list(asa_config.iter_load(sample_config, rules)) == \
+        asa_config.load(sample_config, rules)
+
+
+def test_iter_load_is_incremental(rules, sample_config):
+    stream = _LineStream(sample_config)
+    groups = asa_config.iter_load(stream, rules)
+
+    first = next(groups)
+
+    assert first.root.properties["name"] == "HST_158.87.185.149"
+    assert len(first.children) == 2
+    assert stream.consumed == 5
+
+    rest = list(groups)
+
+    assert len(rest) == 7
+    assert stream.consumed == len(stream.lines)
+
+
+def test_load_records(rules, sample_config):
+    records = asa_config.load(sample_config, rules, models=False)
+    groups = asa_config.load(sample_config, rules)
+
+    assert all(
+        isinstance(record, asa_config.ObjectGroupRecord) for record in records
+    )
+    assert [record.to_model() for record in records] == groups
+    assert isinstance(
+        groups[2].children[0].root.properties["value"],
+        asa_config.Object
+    )
+
+
+def test_records_are_lazy(rules, sample_config):
+    records = asa_config.load(sample_config, rules, models=False)
+    root = records[0].root
+    description = records[0].children[1].root
+    access_list = records[5].root
+
+    assert root.get("name") == "HST_158.87.185.149"
+    assert root.get("missing", 1) == 1
+    assert description.get("value") == "VLAN1026_GSNI-FFM-SDE-IR-10"
+    assert access_list.get("source_address").get("name") == \
+        "GRP_NET1691403080"
+    assert access_list.properties["access"] == "permit"
+    assert access_list.get("access") == "permit"
+    assert pickle.loads(pickle.dumps(description)) == description
+
+
+def test_load_workers(monkeypatch, rules, sample_config):
+    monkeypatch.setattr(asa_config._parallel, "_CHUNK_LINES", 7)
+
+    text = sample_config * 20
+
+    assert asa_config.load(text, rules, workers=2) == \
+        asa_config.load(text, rules)
+    assert asa_config.load(text, rules, models=False, workers=3) == \
+        asa_config.load(text, rules, models=False)
+
+
+def test_load_many_bounds_pending_sources(rules, sample_config):
+    pulled = []
+
+    def sources():
+        for index in range(10):
+            pulled.append(index)
+
+            yield StringIO(sample_config)
+
+    results = asa_config.load_many(sources(), rules, workers=2)
+
+    next(results)
+
+    assert len(pulled) <= 2 * asa_config._parallel._PENDING_SOURCES_PER_WORKER
+
+    assert len(list(results)) == 9
+    assert len(pulled) == 10
+
+
+def test_rule_set_pickle(rules, sample_config):
+    rule_set = pickle.loads(pickle.dumps(asa_config.RuleSet(rules)))
+
+    assert asa_config.load(sample_config, rule_set) == \
+        asa_config.load(sample_config, rules)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_many(tmp_path, rules, sample_config, workers):
+    good = tmp_path / "good.cfg"
+    good.write_text(sample_config)
+    bad = tmp_path / "bad.cfg"
+    bad.write_text("object network A\n  host 1.1.1.1\n    bogus\n")
+    stream = StringIO(sample_config)
+
+    results = {
+        id(result.source): result
+        for result in asa_config.load_many(
+            [good, bad, stream],
+            rules,
+            workers=workers
+        )
+    }
+
+    expected = asa_config.load(sample_config, rules)
+
+    assert results[id(good)].value == expected
+    assert results[id(stream)].value == expected
+    assert isinstance(results[id(bad)].value, Exception)
+    assert all(result.elapsed >= 0 for result in results.values())
@@ -0,0 +1,101 @@
+from textwrap import dedent
+
+import pytest
+
+import asa_config
+from asa_config import Flow
+from asa_config._query import _IntervalIndex
+
+
+CONFIG = dedent(
+    """
+    object network HST_10.0.0.1
+     host 10.0.0.1
+    object network HST_10.0.0.2
+     host 10.0.0.2
+    object network HST_10.0.0.3
+     host 10.0.0.3
+    object network HST_2001:db8::1
+     host 2001:db8::1
+    object-group network GRP_CLIENTS
+     network-object object HST_10.0.0.1
+     network-object object HST_10.0.0.2
+     network-object object HST_2001:db8::1
+    object-group network GRP_SERVERS
+     network-object object HST_10.0.0.3
+    access-list OUT remark web
+    access-list OUT extended permit tcp object-group GRP_CLIENTS object-group GRP_SERVERS eq 443
+    access-list OUT extended deny tcp object-group GRP_CLIENTS object-group GRP_SERVERS range 1000 2000
+    access-list OUT extended permit udp object-group GRP_CLIENTS object-group GRP_SERVERS neq 53
+    access-list OUT extended permit tcp object-group GRP_CLIENTS object-group GRP_SERVERS inactive
+    access-list OUT extended permit tcp object-group GRP_CLIENTS object-group GRP_MISSING
+    access-list OUT extended permit tcp object-group GRP_CLIENTS lt 1024 object-group GRP_SERVERS
+    """
+)
+
+
+@pytest.fixture(params=[True, False], ids=["models", "records"])
+def query(request, rules):
+    return asa_config.AccessListQuery(
+        asa_config.load(CONFIG, rules, models=request.param)
+    )
+
+
+def _lines(query, flow):
+    entries = query.index.access_list("OUT")
+
+    return [entries.index(entry) for entry in query.match("OUT", flow)]
+
+
+def test_query_ports(query):
+    assert _lines(query, Flow("10.0.0.1", "10.0.0.3", "TCP", 443)) == [1, 6]
+    assert _lines(query, Flow("10.0.0.2", "10.0.0.3", "tcp", 1500)) == [2, 6]
+    assert _lines(query, Flow("10.0.0.2", "10.0.0.3", "tcp", 3000)) == [6]
+    assert _lines(
+        query,
+        Flow("10.0.0.2", "10.0.0.3", "tcp", 3000, source_port=5000)
+    ) == []
+    assert _lines(query, Flow("10.0.0.1", "10.0.0.3", "udp", 53)) == []
+    assert _lines(query, Flow("10.0.0.1", "10.0.0.3", "udp", 54)) == [3]
+
+
+def test_query_addresses(query):
+    assert _lines(query, Flow("10.0.0.3", "10.0.0.1", "tcp", 443)) == []
+    assert _lines(query, Flow("2001:db8::1", "10.0.0.3", "tcp", 443)) == \
+        [1, 6]
+    assert _lines(query, Flow("10.0.0.1", "10.0.0.4", "tcp", 443)) == []
+
+
+def test_query_first_match_and_batches(query):
+    flows = [
+        Flow("10.0.0.1", "10.0.0.3", "tcp", 1200),
+        Flow("10.0.0.1", "10.0.0.3", "icmp")
+    ]
+
+    first = query.first_match("OUT", flows[0])
+
+    assert first.root.properties["access"] == "deny"
+    assert query.first_match("OUT", flows[1]) is None
+    assert query.match_many("OUT", flows) == \
+        [query.match("OUT", flow) for flow in flows]
+    assert query.match("MISSING", flows[0]) == []
+
+
+def test_query_invalid_flow(query):
+    with pytest.raises(ValueError):
+        query.match("OUT", Flow("not-an-address", "10.0.0.3", "tcp", 443))
+
+
+def test_interval_index():
+    index = _IntervalIndex(
+        [[(0, 10)], [(5, 5), (20, 30)], [], [(0, 10)], [(8, 25)]]
+    )
+
+    assert len(index.lines) == 4
+    assert index.lookup(-1) == []
+    assert index.lookup(0) == [0, 3]
+    assert index.lookup(5) == [0, 1, 3]
+    assert index.lookup(9) == [0, 3, 4]
+    assert index.lookup(11) == [4]
+    assert index.lookup(25) == [1, 4]
+    assert index.lookup(31) == []
@@ -0,0 +1,82 @@
+import pytest
+
+import asa_config
+
+
+def test_reload_from_scratch(rules, sample_config):
+    result = asa_config.reload(None, sample_config, rules)
+
+    assert result == asa_config.load(sample_config, rules)
+    assert result.reused == 0
+    assert result.matched == len(result)
+
+
+def test_reload_reuses_unchanged_blocks(rules, sample_config):
+    rule_set = asa_config.RuleSet(rules)
+    previous = asa_config.reload(None, sample_config, rule_set)
+
+    changed = sample_config.replace(
+        "object network HST_158.87.185.149",
+        "object network HST_158.87.185.150"
+    )
+    result = asa_config.reload(previous, changed, rule_set)
+
+    assert result == asa_config.load(changed, rule_set)
+    assert result.matched == 1
+    assert result.reused == len(result) - 1
+    assert result[0] is not previous[0]
+    assert all(
+        group is old for group, old in zip(result[1:], previous[1:])
+    )
+
+
+def test_reload_added_and_removed_blocks(rules, sample_config):
+    previous = asa_config.reload(None, sample_config, rules)
+    lines = sample_config.splitlines(keepends=True)
+    changed = "".join(lines[4:]) + "access-list NEW remark added\n"
+
+    result = asa_config.reload(previous, changed, rules)
+
+    assert result == asa_config.load(changed, rules)
+    assert result.matched == 1
+
+
+def test_reload_with_other_rules(rules, sample_config):
+    previous = asa_config.reload(None, sample_config, rules)
+    result = asa_config.reload(previous, sample_config, list(reversed(rules)))
+
+    assert result.reused == 0
+
+    result = asa_config.reload(previous, sample_config, rules, models=False)
+
+    assert result.reused == 0
+    assert [group.to_model() for group in result] == previous.groups
+
+
+def test_reload_errors(rules):
+    with pytest.raises(asa_config.MatchError):
+        asa_config.reload(None, "no-such-rule\n", rules)
+
+
+def test_reload_from_plain_list(rules, sample_config):
+    previous = asa_config.load(sample_config, rules)
+    result = asa_config.reload(previous, sample_config, rules)
+
+    assert result == previous
+    assert result.reused == 0
+
+    with pytest.raises(TypeError):
+        asa_config.reload(object(), sample_config, rules)
+
+
+def test_reload_does_not_alias_identical_blocks(rules):
+    text = "access-list A remark x\n" * 2
+    result = asa_config.reload(None, text, rules)
+
+    assert result[0] == result[1]
+    assert result[0] is not result[1]
+
+    result = asa_config.reload(result, text * 2, rules)
+
+    assert result.reused == 2
+    assert len({id(group) for group in result}) == 4
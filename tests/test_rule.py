@@ -0,0 +1,165 @@
+import tracemalloc
+
+import pytest
+
+import asa_config
+
+from asa_config._argument_load import load as load_argument_groups
+from asa_config._rule import (
+    IntegerRule,
+    LiteralRule,
+    MatchError,
+    OptionalRule,
+    StringRule,
+    TextRule,
+    TupleRule,
+    match_object
+)
+
+
+@pytest.mark.parametrize(
+    "rule, tokens, start, expected",
+    [
+        (IntegerRule(), ["a", "10"], 1, [(10, 2)]),
+        (IntegerRule(), ["a", "b"], 1, []),
+        (LiteralRule(value="permit"), ["PERMIT"], 0, [("PERMIT", 1)]),
+        (LiteralRule(value="permit"), [], 0, []),
+        (StringRule(), ["a", "b"], 2, []),
+        (OptionalRule(IntegerRule()), ["a"], 0, [(None, 0)]),
+        (
+            TupleRule(values=[StringRule(), OptionalRule(IntegerRule())]),
+            ["a", "1"],
+            0,
+            [(("a", 1), 2), (("a", None), 1)]
+        )
+    ]
+)
+def test_match_at(rule, tokens, start, expected):
+    assert list(rule.match_at(tokens, start)) == expected
+
+
+def test_text_rule_is_lazy():
+    [(value, end)] = TextRule().match_at(["a", "b", "c"], 1)
+
+    assert (str(value), end) == ("b c", 3)
+    assert list(TextRule().match(["a", "b", "c"])) == [("a b c", [])]
+
+
+def test_match_shim():
+    rule = TupleRule(values=[StringRule(), OptionalRule(IntegerRule())])
+
+    assert list(rule.match(["a", "1", "b"])) == [
+        (("a", 1), ["b"]),
+        (("a", None), ["1", "b"])
+    ]
+
+    with pytest.raises(MatchError):
+        list(IntegerRule().match(["a"]))
+
+
+def _peak_match_allocation(rule, tokens):
+    tracemalloc.start()
+
+    try:
+        next(rule.match_at(tokens, 0))
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_match_at_allocations_are_linear():
+    def peak(count):
+        rule = TupleRule(values=[StringRule() for _ in range(count)])
+        tokens = [f"token{index}" for index in range(count)]
+
+        return _peak_match_allocation(rule, tokens)
+
+    assert peak(400) < 6 * peak(100)
+
+
+def test_match_at_large_acl(rules, sample_config):
+    rule = next(
+        rule for rule in rules
+        if rule.name == "access-list" and len(rule.properties) > 3
+    )
+    groups = [
+        group for group in load_argument_groups(sample_config * 200)
+        if group.root[2:3] in (["extended"], ["line"])
+        and "remark" not in group.root
+    ]
+
+    assert len(groups) == 600
+
+    for group in groups:
+        expected, rest = next(rule.match(group.root))
+        result, end = next(rule.match_at(group.root, 0))
+
+        assert result == expected
+        assert group.root[end:] == rest
+
+    peak = _peak_match_allocation(rule, groups[0].root)
+
+    assert peak < 64 * 1024
+
+
+@pytest.mark.parametrize(
+    "rule, tokens, expected",
+    [
+        (IntegerRule(), ["a", "10"], (10, 2)),
+        (IntegerRule(), ["a", "b"], None),
+        (LiteralRule(value="permit"), ["a", "PERMIT"], ("PERMIT", 2)),
+        (OptionalRule(IntegerRule()), ["a", "b"], (None, 1)),
+        (TupleRule(values=[]), ["a"], None),
+        (
+            TupleRule(values=[OptionalRule(StringRule()), StringRule()]),
+            ["a", "b"],
+            None
+        ),
+        (
+            TupleRule(values=[StringRule(), OptionalRule(IntegerRule())]),
+            ["a", "b", "1"],
+            (("b", 1), 3)
+        )
+    ]
+)
+def test_match_first(rule, tokens, expected):
+    assert rule.match_first(tokens, 1) == expected
+
+
+def test_match_object_consumes_all_tokens(rules):
+    arguments = (
+        "access-list MY_ACL extended permit sctp object-group A "
+        "object-group B log disable time-range WORKDAYS inactive"
+    ).split(" ")
+
+    result, _ = match_object(arguments, rules)
+
+    assert result.properties["log"].properties["options"] == "disable"
+    assert result.properties["time_range"].properties["name"] == "WORKDAYS"
+    assert result.properties["inactive"] == "inactive"
+
+    ambiguous, _ = match_object(arguments, rules, ambiguous=True)
+
+    assert ambiguous.properties["log"].properties["options"] == (None, None)
+    assert ambiguous.properties["inactive"] is None
+
+
+def test_match_object_falls_back_to_first_partial_decision(rules):
+    arguments = "access-list MY_ACL line 2 extended permit tcp".split(" ")
+
+    with pytest.raises(MatchError):
+        match_object(arguments + ["object-group", "A", "junk"], rules)
+
+    arguments += ["object-group", "S", "object-group", "D", "eq", "https"]
+    result, _ = match_object(arguments, rules)
+
+    assert result == match_object(arguments, rules, ambiguous=True)[0]
+    assert result.properties["destination_address"].properties["name"] == \
+        "D"
+    assert result.properties["destination_port"] is None
+
+    text = " ".join(arguments) + "\n"
+
+    assert asa_config.load(text, rules) == \
+        asa_config.load(text, rules, ambiguous=True)
@@ -0,0 +1,55 @@
+import pytest
+
+from asa_config._argument_load import load as load_argument_groups
+from asa_config._rule import MatchError, match_object, match_object_group
+from asa_config._rule_set import RuleSet, compile_rules
+
+
+def test_compile_rules_is_idempotent(rules):
+    rule_set = compile_rules(rules)
+
+    assert compile_rules(rule_set) is rule_set
+    assert list(rule_set) == rules
+
+
+@pytest.mark.parametrize(
+    "arguments, expected",
+    [
+        ("access-list MY_ACL remark aaa", [("access-list", 3)]),
+        ("access-list MY_ACL line 3 remark aaa", [("access-list", 3)]),
+        (
+            "access-list MY_ACL extended permit tcp object-group A",
+            [("access-list", 15)]
+        ),
+        ("access-list MY_ACL standard permit", []),
+        ("object network HST_1", [("object", 2)]),
+        ("object service SVC_1", []),
+        ("unknown command", [])
+    ]
+)
+def test_select(rules, arguments, expected):
+    rule_set = RuleSet(rules)
+    selected = rule_set.select(arguments.split(" "))
+
+    assert [(rule.name, len(rule.properties)) for rule in selected] == \
+        expected
+
+
+def test_select_empty_arguments(rules):
+    assert list(RuleSet(rules).select([])) == []
+
+    with pytest.raises(MatchError):
+        match_object([], RuleSet(rules))
+
+
+def test_matches_linear_rule_search(rules, sample_config):
+    rule_set = RuleSet(rules)
+
+    for group in load_argument_groups(sample_config):
+        expected, expected_rule = match_object(group.root, rules)
+        result, rule = match_object(group.root, rule_set)
+
+        assert result == expected
+        assert rule is expected_rule
+        assert match_object_group(group, rule_set) == \
+            match_object_group(group, rules)
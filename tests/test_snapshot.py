@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+
+import pytest
+
+import asa_config
+import asa_config._snapshot
+
+
+@pytest.fixture(params=[True, False], ids=["models", "records"])
+def groups(request, rules, sample_config):
+    return asa_config.load(sample_config, rules, models=request.param)
+
+
+def test_snapshot_round_trip(tmp_path, rules, sample_config, groups):
+    path = tmp_path / "config.snapshot"
+
+    asa_config.dump_snapshot(groups, path)
+
+    with asa_config.load_snapshot(path) as snapshot:
+        assert len(snapshot) == len(groups)
+        assert list(snapshot) == groups
+        assert snapshot.to_models() == asa_config.load(sample_config, rules)
+
+
+def test_snapshot_views_are_lazy(tmp_path, groups):
+    path = tmp_path / "config.snapshot"
+
+    asa_config.dump_snapshot(groups, path)
+
+    with asa_config.load_snapshot(path) as snapshot:
+        entry = snapshot[-1]
+
+        assert all(value is None for value in snapshot._strings)
+        assert entry.root.name == "access-list"
+        assert entry.root.get("line").get("number") == 7
+        assert entry.root.properties["log"].properties["options"] == \
+            "disable"
+        assert snapshot[5].root.properties["log"].properties["options"] == \
+            (None, None)
+        assert snapshot[2].children[1].root.properties["value"].name == \
+            "object"
+        assert None in snapshot._strings
+
+        with pytest.raises(IndexError):
+            snapshot[len(snapshot)]
+
+
+def test_snapshot_views_round_trip(tmp_path, groups):
+    first = tmp_path / "first.snapshot"
+    second = tmp_path / "second.snapshot"
+
+    asa_config.dump_snapshot(groups, first)
+
+    with asa_config.load_snapshot(first) as snapshot:
+        asa_config.dump_snapshot(snapshot, second)
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_snapshot_errors(tmp_path):
+    path = tmp_path / "config.snapshot"
+
+    for content in (b"", b"not a snapshot" * 4):
+        path.write_bytes(content)
+
+        with pytest.raises(asa_config.SnapshotError):
+            asa_config.load_snapshot(path)
+
+    asa_config.dump_snapshot([], path)
+    path.write_bytes(path.read_bytes() + b"\0")
+
+    with pytest.raises(asa_config.SnapshotError):
+        asa_config.load_snapshot(path)
+
+
+def test_snapshot_large_integers(tmp_path):
+    path = tmp_path / "config.snapshot"
+    root = asa_config.Object(
+        name="object",
+        properties={"id": 1 << 40, "ports": (-5, 1 << 33, "eq")}
+    )
+
+    group = asa_config.ObjectGroup(root=root, children=[])
+
+    asa_config.dump_snapshot([group], path)
+
+    with asa_config.load_snapshot(path) as snapshot:
+        assert snapshot[0].root.properties == {
+            "id": 1 << 40,
+            "ports": (-5, 1 << 33, "eq")
+        }
+
+
+def test_snapshot_write_error(tmp_path):
+    path = tmp_path / "config.snapshot"
+    root = asa_config.Object(name="object", properties={"value": 1.5})
+    group = asa_config.ObjectGroup(root=root, children=[])
+
+    with pytest.raises(asa_config.SnapshotError):
+        asa_config.dump_snapshot([group], path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_swapped_byte_order(tmp_path, monkeypatch, groups):
+    path = tmp_path / "config.snapshot"
+
+    monkeypatch.setattr(
+        asa_config._snapshot,
+        "sys",
+        SimpleNamespace(byteorder="big")
+    )
+
+    asa_config.dump_snapshot(groups, path)
+
+    with asa_config.load_snapshot(path) as snapshot:
+        assert list(snapshot) == groups
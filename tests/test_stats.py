@@ -0,0 +1,100 @@
+import pytest
+
+import asa_config
+
+
+def test_load_stats(rules, sample_config):
+    stats = asa_config.MatchStats()
+
+    result = asa_config.load(
+        sample_config,
+        rules,
+        stats=stats,
+        ambiguous=True
+    )
+
+    assert result == asa_config.load(sample_config, rules, ambiguous=True)
+
+    exported = stats.as_dict()
+
+    assert set(exported["stages"]) == {"tokenize", "group", "match", "models"}
+
+    access_list = exported["rules"]["access-list"]
+
+    assert access_list["attempts"] == 5
+    assert access_list["successes"] == 5
+    assert access_list["properties"]["name"]["attempts"] == 5
+    assert access_list["properties"]["type"]["successes"] == 3
+    assert exported["rules"]["object"]["successes"] == 2
+    value = exported["rules"]["network-object"]["properties"]["value"]
+
+    assert (value["attempts"], value["successes"], value["backtracks"]) == \
+        (2, 2, 0)
+    assert value["seconds"] >= 0
+
+
+def test_first_match_stats(rules, sample_config):
+    stats = asa_config.MatchStats()
+
+    asa_config.load(sample_config, rules, stats=stats)
+
+    access_list = stats.as_dict()["rules"]["access-list"]
+
+    # The last entry leaves tokens over on the first-match path and is
+    # matched again by the backtracking fallback.
+    assert access_list["successes"] == 5
+    assert access_list["properties"]["name"]["attempts"] == 6
+
+
+def test_stats_context_manager(rules, sample_config):
+    with asa_config.MatchStats() as stats:
+        assert asa_config.current_stats() is stats
+
+        asa_config.load(sample_config, rules, models=False)
+
+    assert asa_config.current_stats() is None
+    assert "models" not in stats.stages
+    assert stats.rule("object-group").successes == 1
+
+
+def test_stats_count_backtracks(rules):
+    stats = asa_config.MatchStats()
+    text = "access-list A extended permit tcp object-group B object-group C\n"
+
+    asa_config.load(text, rules, stats=stats)
+
+    # "object-group C" is first taken as the source port, which leaves no
+    # destination address, so the port has to backtrack to "no port".
+    assert stats.rule("access-list", "source_port").backtracks == 1
+    assert stats.rule("access-list").backtracks == 0
+
+
+def test_stats_rule_dispatch_is_not_backtracking(rules):
+    with asa_config.MatchStats() as stats:
+        asa_config.match_object(["access-list", "A", "remark", "x"], rules)
+
+    failed = [
+        rule_stats
+        for (name, property), rule_stats in stats.rules.items()
+        if property is None and rule_stats.successes == 0
+    ]
+
+    assert failed
+    assert all(rule_stats.attempts == 1 for rule_stats in failed)
+    assert all(rule_stats.backtracks == 0 for rule_stats in failed)
+
+
+def test_stats_disabled_by_default(rules, sample_config):
+    asa_config.load(sample_config, rules)
+
+    assert asa_config.current_stats() is None
+
+
+def test_stats_with_workers(rules, sample_config):
+    with pytest.raises(ValueError):
+        asa_config.load(
+            sample_config,
+            rules,
+            workers=2,
+            stats=asa_config.MatchStats()
+        )